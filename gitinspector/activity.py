@@ -19,10 +19,56 @@
 
 
 import datetime
+import functools
+import sys
+from collections import defaultdict
+from itertools import chain
 from . import filtering
 
 
+def _new_period_bucket():
+    return {
+        "commits": 0,
+        "insertions": 0,
+        "deletions": 0,
+        "contributors": 0,  # Number of unique contributors in the period
+    }
+
+
+# Shared read-only defaults for repositories/periods without activity
+_EMPTY_REPO = {}
+_EMPTY_STATS = {"commits": 0, "insertions": 0, "deletions": 0, "contributors": 0}
+
+
+@functools.lru_cache(maxsize=None)
+def _period_from_date(date_str, useweeks):
+    """Convert date string (YYYY-MM-DD) to period string (YYYY-MM or YYYY-WNN).
+
+    Memoized since many commits share the same date.
+    """
+    if not useweeks:
+        # Months are a plain slice; malformed dates fall back to the same slice anyway
+        return date_str[0:7] if len(date_str) >= 7 else date_str  # YYYY-MM
+
+    try:
+        yearweek = datetime.date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])).isocalendar()
+        return f"{yearweek[0]}W{yearweek[1]:02d}"
+    except (ValueError, IndexError):
+        # Fallback for malformed dates
+        return date_str[0:7] if len(date_str) >= 7 else date_str
+
+
 class ActivityData(object):
+    __slots__ = (
+        "changes_by_repo",
+        "useweeks",
+        "repo_activity",
+        "repo_contributors",
+        "all_periods",
+        "_max_cache",
+        "_total_cache",
+    )
+
     def __init__(self, changes_by_repo, useweeks):
         """
         Initialize activity data for repository-level statistics over time periods.
@@ -33,65 +79,63 @@ class ActivityData(object):
         """
         self.changes_by_repo = changes_by_repo
         self.useweeks = useweeks
-        self.repo_activity = {}  # {repo_name: {period: {commits, insertions, deletions, contributors, authors}}}
+        self.repo_activity = {}  # {repo_name: {period: {commits, insertions, deletions, contributors}}}
+        self.repo_contributors = {}  # {repo_name: set of contributors across all periods}
         self.all_periods = set()
+        self._max_cache = {}  # {normalized: max values}, data is immutable after construction
+        self._total_cache = {}  # {normalized: total stats}
+
+        # Periods of team-filtered records, kept so the fallback below needs no second pass
+        filtered_periods = set()
+        # Team membership depends only on the author, so resolve it once per unique author
+        author_filtered = {}
 
         # Process each repository's data
         for repo_name, changes in changes_by_repo.items():
-            self.repo_activity[repo_name] = {}
-            authordateinfo_list = sorted(changes.get_authordateinfo_list().items())
-
-            # Aggregate data by time period
-            for date_author_info, author_stats in authordateinfo_list:
-                date_str, author = date_author_info
+            repo_periods = self.repo_activity[repo_name] = defaultdict(_new_period_bucket)
+            contributors = self.repo_contributors[repo_name] = set()
+            # (period, author) pairs already counted; only needed while aggregating
+            seen_in_period = set()
 
+            # Aggregate data by time period; summing into buckets is order-independent
+            for (date_str, author), author_stats in changes.get_authordateinfo_list().items():
                 # Apply team filtering - skip authors not in team config
-                if filtering.is_author_team_filtered(author):
-                    continue
-
                 period = self._get_period_from_date(date_str)
-                self.all_periods.add(period)
+                is_filtered = author_filtered.get(author)
+                if is_filtered is None:
+                    is_filtered = author_filtered[author] = filtering.is_author_team_filtered(author)
+                if is_filtered:
+                    filtered_periods.add(period)
+                    continue
 
-                if period not in self.repo_activity[repo_name]:
-                    self.repo_activity[repo_name][period] = {
-                        "commits": 0,
-                        "insertions": 0,
-                        "deletions": 0,
-                        "contributors": set(),  # Track unique contributors per period
-                        "authors": set(),  # For debugging/validation
-                    }
+                bucket = repo_periods[period]
 
                 # Add to repository totals for this period
-                self.repo_activity[repo_name][period]["commits"] += 1
-                self.repo_activity[repo_name][period]["insertions"] += author_stats.insertions
-                self.repo_activity[repo_name][period]["deletions"] += author_stats.deletions
-                self.repo_activity[repo_name][period]["contributors"].add(author)
-                self.repo_activity[repo_name][period]["authors"].add(author)
+                bucket["commits"] += 1
+                bucket["insertions"] += author_stats.insertions
+                bucket["deletions"] += author_stats.deletions
+
+                author = sys.intern(author)
+                if (period, author) not in seen_in_period:
+                    seen_in_period.add((period, author))
+                    bucket["contributors"] += 1
+                    contributors.add(author)
+
+        # Periods are exactly the bucket keys, so collect them once instead of per record
+        for repo_periods in self.repo_activity.values():
+            self.all_periods.update(repo_periods)
 
         # If team filtering removed all periods, fall back to timeline skeleton
         # derived from all commit dates (unfiltered) so charts have an x-axis.
+        # With nothing aggregated, every record was filtered, so filtered_periods covers them all.
         if len(self.all_periods) == 0:
-            fallback_periods = set()
-            for _repo_name, _changes in changes_by_repo.items():
-                for (date_str, _author), _stats in _changes.get_authordateinfo_list().items():
-                    fallback_periods.add(self._get_period_from_date(date_str))
-            self.all_periods = fallback_periods
+            self.all_periods = filtered_periods
 
-        self.all_periods = sorted(list(self.all_periods))
+        self.all_periods = sorted(self.all_periods)
 
     def _get_period_from_date(self, date_str):
         """Convert date string (YYYY-MM-DD) to period string (YYYY-MM or YYYY-WNN)"""
-        try:
-            date_obj = datetime.date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
-
-            if self.useweeks:
-                yearweek = date_obj.isocalendar()
-                return str(yearweek[0]) + "W" + "{0:02d}".format(yearweek[1])
-            else:
-                return date_str[0:7]  # YYYY-MM
-        except (ValueError, IndexError):
-            # Fallback for malformed dates
-            return date_str[0:7] if len(date_str) >= 7 else date_str
+        return _period_from_date(date_str, self.useweeks)
 
     def get_repositories(self):
         """Get list of repository names"""
@@ -103,17 +147,15 @@ class ActivityData(object):
 
     def get_repo_stats_for_period(self, repo_name, period, normalized=False):
         """Get statistics for a specific repository and period"""
-        raw_stats = self.repo_activity.get(repo_name, {}).get(
-            period, {"commits": 0, "insertions": 0, "deletions": 0, "contributors": set(), "authors": set()}
-        )
+        raw_stats = self.repo_activity.get(repo_name, _EMPTY_REPO).get(period, _EMPTY_STATS)
 
-        # Convert sets to counts and prepare return data
+        # Prepare return data; per-period contributors are already stored as counts
         stats = {
             "commits": raw_stats["commits"],
             "insertions": raw_stats["insertions"],
             "deletions": raw_stats["deletions"],
-            "contributors": len(raw_stats["contributors"]),
-            "authors": len(raw_stats["authors"]),
+            "contributors": raw_stats["contributors"],
+            "authors": raw_stats["contributors"],
         }
 
         # Apply normalization if requested
@@ -130,6 +172,10 @@ class ActivityData(object):
 
     def get_max_values(self, normalized=False):
         """Get maximum values across all repositories and periods for scaling charts"""
+        cached = self._max_cache.get(bool(normalized))
+        if cached is not None:
+            return dict(cached)
+
         max_commits = 0
         max_insertions = 0
         max_deletions = 0
@@ -137,49 +183,57 @@ class ActivityData(object):
         max_insertions_per_contributor = 0
         max_deletions_per_contributor = 0
 
-        for repo_name in self.repo_activity:
-            for period in self.repo_activity[repo_name]:
-                stats = self.get_repo_stats_for_period(repo_name, period, normalized)
-                max_commits = max(max_commits, stats["commits"])
-                max_insertions = max(max_insertions, stats["insertions"])
-                max_deletions = max(max_deletions, stats["deletions"])
+        # Reduce over the raw buckets directly instead of building a stats dict per cell
+        for repo_periods in self.repo_activity.values():
+            for raw in repo_periods.values():
+                commits = raw["commits"]
+                insertions = raw["insertions"]
+                deletions = raw["deletions"]
+                if commits > max_commits:
+                    max_commits = commits
+                if insertions > max_insertions:
+                    max_insertions = insertions
+                if deletions > max_deletions:
+                    max_deletions = deletions
 
                 if normalized:
-                    max_commits_per_contributor = max(max_commits_per_contributor, stats["commits_per_contributor"])
-                    max_insertions_per_contributor = max(
-                        max_insertions_per_contributor, stats["insertions_per_contributor"]
-                    )
-                    max_deletions_per_contributor = max(
-                        max_deletions_per_contributor, stats["deletions_per_contributor"]
-                    )
+                    contributors = raw["contributors"]
+                    if contributors:
+                        max_commits_per_contributor = max(max_commits_per_contributor, commits / contributors)
+                        max_insertions_per_contributor = max(max_insertions_per_contributor, insertions / contributors)
+                        max_deletions_per_contributor = max(max_deletions_per_contributor, deletions / contributors)
 
         result = {"commits": max_commits, "insertions": max_insertions, "deletions": max_deletions}
 
         if normalized:
             result.update(
                 {
-                    "commits_per_contributor": max_commits_per_contributor,
-                    "insertions_per_contributor": max_insertions_per_contributor,
-                    "deletions_per_contributor": max_deletions_per_contributor,
+                    # Rounding is monotonic, so rounding the maxima matches the per-cell rounded values
+                    "commits_per_contributor": round(max_commits_per_contributor, 2),
+                    "insertions_per_contributor": round(max_insertions_per_contributor, 2),
+                    "deletions_per_contributor": round(max_deletions_per_contributor, 2),
                 }
             )
 
-        return result
+        self._max_cache[bool(normalized)] = result
+        return dict(result)
 
     def get_total_stats(self, normalized=False):
         """Get total statistics across all repositories and periods"""
+        cached = self._total_cache.get(bool(normalized))
+        if cached is not None:
+            return dict(cached)
+
         total_commits = 0
         total_insertions = 0
         total_deletions = 0
-        total_contributors = set()  # Track unique contributors across all repos
-
-        for repo_name in self.repo_activity:
-            for period in self.repo_activity[repo_name]:
-                period_data = self.repo_activity[repo_name][period]
-                total_commits += period_data["commits"]
-                total_insertions += period_data["insertions"]
-                total_deletions += period_data["deletions"]
-                total_contributors.update(period_data["contributors"])
+        for repo_periods in self.repo_activity.values():
+            for data in repo_periods.values():
+                total_commits += data["commits"]
+                total_insertions += data["insertions"]
+                total_deletions += data["deletions"]
+        # Track unique contributors across all repos
+        total_contributors = set(chain.from_iterable(self.repo_contributors.values()))
 
         result = {
             "commits": total_commits,
@@ -197,13 +251,10 @@ class ActivityData(object):
                 }
             )
 
-        return result
+        self._total_cache[bool(normalized)] = result
+        return dict(result)
 
     def get_repo_unique_contributors(self, repo_name):
         """Get unique contributors for a specific repository across all periods"""
-        unique_contributors = set()
-        if repo_name in self.repo_activity:
-            for period_data in self.repo_activity[repo_name].values():
-                if "contributors" in period_data and isinstance(period_data["contributors"], set):
-                    unique_contributors.update(period_data["contributors"])
-        return unique_contributors
+        # Return a copy so callers cannot change the collected contributors
+        return set(self.repo_contributors.get(repo_name, ()))
@@ -7,11 +7,24 @@ Uses JSON files to store cached data locally.
 """
 
 import os
+import functools
+import gzip
 import json
+import shutil
 import time
+import zlib
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Any
 from pathlib import Path
+from urllib.parse import quote
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; the stdlib json module is used without it
+    orjson = None
 
 
 class GitHubCacheError(Exception):
@@ -20,8 +33,49 @@ class GitHubCacheError(Exception):
     pass
 
 
+# Kinds of data cached per repository, each stored in its own file
+CACHE_KINDS = ("pull_requests", "reviews", "comments", "review_comments", "general_comments")
+
+
+# Repository data files are gzip-compressed JSON; GitHub payloads repeat the same
+# user, URL and label fields over and over, so they shrink several times over
+DATA_FILE_SUFFIX = ".json.gz"
+
+# Base name of the GitHub integration's ETag store in the cache directory; the dbm backend
+# adds its own suffixes (etags.dat, etags.dir, ...), so files are matched by this prefix
+ETAG_STORE_NAME = "etags"
+
+# Timestamp fields marking the latest activity of a cached item, in order of preference
+ACTIVITY_FIELDS = {
+    "pull_requests": ("updated_at",),
+    "reviews": ("submitted_at", "created_at"),
+    "comments": ("updated_at", "created_at"),
+    "review_comments": ("updated_at", "created_at"),
+}
+
+
+def _activity_time(item: Dict, fields) -> Optional[str]:
+    """Get the first timestamp set on an item among the given fields."""
+    for field in fields:
+        if item.get(field):
+            return item[field]
+    return None
+
+
+def _latest_timestamp(items: Iterable[Dict], fields) -> Optional[str]:
+    """Get the latest activity timestamp among items, or None if none carries one."""
+    timestamps = (_activity_time(item, fields) for item in items)
+    return max((timestamp for timestamp in timestamps if timestamp), default=None)
+
+
+@functools.lru_cache(maxsize=None)
+def _safe_name(repository: str) -> str:
+    """Turn an "owner/repo" name into a single, reversible directory name."""
+    return quote(repository, safe="")
+
+
 class GitHubCache:
-    """GitHub data cache using JSON files."""
+    """GitHub data cache using JSON files, sharded per repository."""
 
     def __init__(self, cache_dir: str = ".github_cache"):
         """
@@ -33,30 +87,100 @@ class GitHubCache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
 
-        # Cache file paths
+        # Cache file paths; repository data lives in repositories/<repo>/<kind>.json
         self.metadata_file = self.cache_dir / "metadata.json"
-        self.prs_file = self.cache_dir / "pull_requests.json"
-        self.reviews_file = self.cache_dir / "reviews.json"
-        self.comments_file = self.cache_dir / "comments.json"
-        self.review_comments_file = self.cache_dir / "review_comments.json"
-        self.general_comments_file = self.cache_dir / "general_comments.json"
+        self.repositories_dir = self.cache_dir / "repositories"
+
+        # Parsed cache files, loaded on first use and written back on flush()
+        self._documents: Dict[Path, Any] = {}
+        self._dirty: set = set()
+        self._repository_files: Dict[tuple, Path] = {}
+
+        self._migrate_legacy_files()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def _repository_file(self, repository: str, kind: str) -> Path:
+        """Get the cache file holding one kind of data for a repository."""
+        # Called for every cache operation, so build each Path only once
+        file_path = self._repository_files.get((repository, kind))
+        if file_path is None:
+            file_path = self._repository_files[(repository, kind)] = (
+                self.repositories_dir / _safe_name(repository) / f"{kind}{DATA_FILE_SUFFIX}"
+            )
+        return file_path
+
+    def _migrate_legacy_files(self) -> None:
+        """Split cache files from the old single-file layout into per-repository files."""
+        for kind in CACHE_KINDS:
+            legacy_file = self.cache_dir / f"{kind}.json"
+            if not legacy_file.exists():
+                continue
+
+            for repository, data in self._read_json_file(legacy_file).items():
+                self._save_json_file(self._repository_file(repository, kind), data)
+            self.flush()
+            legacy_file.unlink()
+
+    def _load_json_file(self, file_path: Path, default=dict) -> Any:
+        """Load JSON data for a cache file, parsing it from disk only once."""
+        data = self._documents.get(file_path)
+        if data is None:
+            data = self._documents[file_path] = self._read_json_file(file_path, default)
+        return data
+
+    def _save_json_file(self, file_path: Path, data: Dict) -> None:
+        """Stage JSON data for a cache file; it is written to disk on flush()."""
+        self._documents[file_path] = data
+        self._dirty.add(file_path)
+
+    def flush(self) -> None:
+        """Write all modified cache files to disk."""
+        for file_path in list(self._dirty):
+            self._write_json_file(file_path, self._documents[file_path])
+            self._dirty.discard(file_path)
 
-    def _load_json_file(self, file_path: Path) -> Dict:
+    def _read_json_file(self, file_path: Path, default=dict) -> Any:
         """Load JSON data from file."""
         if not file_path.exists():
-            return {}
+            return default()
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            payload = file_path.read_bytes()
+            if file_path.suffix == ".gz":
+                payload = gzip.decompress(payload)
+            if orjson is not None:
+                return orjson.loads(payload)
+            return json.loads(payload)
+        except (json.JSONDecodeError, IOError, EOFError, zlib.error) as e:
             raise GitHubCacheError(f"Failed to load cache file {file_path}: {str(e)}")
 
-    def _save_json_file(self, file_path: Path, data: Dict) -> None:
-        """Save JSON data to file."""
+    def _write_json_file(self, file_path: Path, data: Dict) -> None:
+        """Save JSON data to file atomically, so a crash never leaves a torn cache file."""
+        # Only the small metadata file is pretty-printed; the data files are machine-read
+        pretty = file_path == self.metadata_file
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0))
+        elif pretty:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        else:
+            payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        if file_path.suffix == ".gz":
+            # The fastest level already captures most of the redundancy in GitHub JSON
+            payload = gzip.compress(payload, compresslevel=1)
+
+        tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
         except IOError as e:
             raise GitHubCacheError(f"Failed to save cache file {file_path}: {str(e)}")
 
@@ -81,6 +205,9 @@ class GitHubCache:
 
         self._save_json_file(self.metadata_file, metadata)
 
+        # Metadata marks the repository as synced, so persist its data along with it
+        self.flush()
+
     def is_repository_cached(self, repository: str) -> bool:
         """Check if repository data is cached."""
         metadata = self.get_cache_metadata()
@@ -92,139 +219,172 @@ class GitHubCache:
         repo_data = metadata.get("repositories", {}).get(repository)
         return repo_data.get("last_sync") if repo_data else None
 
+    def _get_latest_activity_index(self) -> Dict[str, str]:
+        """Get the per-repository latest activity timestamps kept in metadata."""
+        return self.get_cache_metadata().setdefault("latest_activity", {})
+
+    def _reset_latest_activity(self, repository: str) -> None:
+        """Forget the recorded latest activity after cached data was replaced."""
+        latest_activity = self._get_latest_activity_index()
+        if repository in latest_activity:
+            del latest_activity[repository]
+            self._save_json_file(self.metadata_file, self.get_cache_metadata())
+
+    def _record_latest_activity(self, repository: str, kind: str, items: List[Dict]) -> None:
+        """Advance the recorded latest activity with newly merged items."""
+        latest_activity = self._get_latest_activity_index()
+        if repository not in latest_activity:
+            # Nothing recorded yet; get_latest_activity_time rebuilds it with a full scan
+            return
+
+        batch_time = _latest_timestamp(items, ACTIVITY_FIELDS[kind])
+        if batch_time and batch_time > latest_activity[repository]:
+            latest_activity[repository] = batch_time
+            self._save_json_file(self.metadata_file, self.get_cache_metadata())
+
+    def _store_pull_requests(self, repository: str, prs: List[Dict]) -> None:
+        self._save_json_file(self._repository_file(repository, "pull_requests"), list(prs))
+
+    def _store_pr_items(self, kind: str, repository: str, pr_number: int, items: List[Dict]) -> None:
+        file_path = self._repository_file(repository, kind)
+        data = self._load_json_file(file_path)
+        data[str(pr_number)] = list(items)
+        self._save_json_file(file_path, data)
+
+    def _store_many_pr_items(self, kind: str, repository: str, items_by_pr: Dict[int, List[Dict]]) -> None:
+        file_path = self._repository_file(repository, kind)
+        data = self._load_json_file(file_path)
+        data.update((str(pr_number), list(items)) for pr_number, items in items_by_pr.items())
+        self._save_json_file(file_path, data)
+
     def cache_pull_requests(self, repository: str, prs: List[Dict]) -> None:
         """Cache pull requests for a repository."""
-        prs_data = self._load_json_file(self.prs_file)
-        prs_data[repository] = prs
-        self._save_json_file(self.prs_file, prs_data)
+        self._store_pull_requests(repository, prs)
+        self._reset_latest_activity(repository)
 
     def get_cached_pull_requests(self, repository: str) -> List[Dict]:
-        """Get cached pull requests for a repository."""
-        prs_data = self._load_json_file(self.prs_file)
-        return prs_data.get(repository, [])
+        """
+        Get cached pull requests for a repository.
+
+        The cache and its callers never share lists: the cache_* methods store copies of the lists
+        they are given and the get_cached_* methods return copies, so either side may modify its list.
+        """
+        return list(self._load_json_file(self._repository_file(repository, "pull_requests"), list))
 
     def cache_reviews(self, repository: str, pr_number: int, reviews: List[Dict]) -> None:
         """Cache reviews for a specific PR."""
-        reviews_data = self._load_json_file(self.reviews_file)
-
-        if repository not in reviews_data:
-            reviews_data[repository] = {}
+        self._store_pr_items("reviews", repository, pr_number, reviews)
+        self._reset_latest_activity(repository)
 
-        reviews_data[repository][str(pr_number)] = reviews
-        self._save_json_file(self.reviews_file, reviews_data)
+    def cache_many_reviews(self, repository: str, reviews_by_pr: Dict[int, List[Dict]]) -> None:
+        """Cache reviews for several PRs at once, keyed by PR number."""
+        self._store_many_pr_items("reviews", repository, reviews_by_pr)
+        self._reset_latest_activity(repository)
 
     def get_cached_reviews(self, repository: str, pr_number: int) -> List[Dict]:
         """Get cached reviews for a specific PR."""
-        reviews_data = self._load_json_file(self.reviews_file)
-        return reviews_data.get(repository, {}).get(str(pr_number), [])
+        reviews_data = self._load_json_file(self._repository_file(repository, "reviews"))
+        return list(reviews_data.get(str(pr_number), []))
 
     def cache_comments(self, repository: str, pr_number: int, comments: List[Dict]) -> None:
         """Cache comments for a specific PR."""
-        comments_data = self._load_json_file(self.comments_file)
+        self._store_pr_items("comments", repository, pr_number, comments)
+        self._reset_latest_activity(repository)
 
-        if repository not in comments_data:
-            comments_data[repository] = {}
-
-        comments_data[repository][str(pr_number)] = comments
-        self._save_json_file(self.comments_file, comments_data)
+    def cache_many_comments(self, repository: str, comments_by_pr: Dict[int, List[Dict]]) -> None:
+        """Cache comments for several PRs at once, keyed by PR number."""
+        self._store_many_pr_items("comments", repository, comments_by_pr)
+        self._reset_latest_activity(repository)
 
     def get_cached_comments(self, repository: str, pr_number: int) -> List[Dict]:
         """Get cached comments for a specific PR."""
-        comments_data = self._load_json_file(self.comments_file)
-        return comments_data.get(repository, {}).get(str(pr_number), [])
+        comments_data = self._load_json_file(self._repository_file(repository, "comments"))
+        return list(comments_data.get(str(pr_number), []))
 
     def cache_review_comments(self, repository: str, pr_number: int, review_comments: List[Dict]) -> None:
         """Cache review comments for a specific PR."""
-        review_comments_data = self._load_json_file(self.review_comments_file)
-
-        if repository not in review_comments_data:
-            review_comments_data[repository] = {}
+        self._store_pr_items("review_comments", repository, pr_number, review_comments)
+        self._reset_latest_activity(repository)
 
-        review_comments_data[repository][str(pr_number)] = review_comments
-        self._save_json_file(self.review_comments_file, review_comments_data)
+    def cache_many_review_comments(self, repository: str, review_comments_by_pr: Dict[int, List[Dict]]) -> None:
+        """Cache review comments for several PRs at once, keyed by PR number."""
+        self._store_many_pr_items("review_comments", repository, review_comments_by_pr)
+        self._reset_latest_activity(repository)
 
     def get_cached_review_comments(self, repository: str, pr_number: int) -> List[Dict]:
         """Get cached review comments for a specific PR."""
-        review_comments_data = self._load_json_file(self.review_comments_file)
-        return review_comments_data.get(repository, {}).get(str(pr_number), [])
+        review_comments_data = self._load_json_file(self._repository_file(repository, "review_comments"))
+        return list(review_comments_data.get(str(pr_number), []))
 
     def cache_general_comments(self, repository: str, pr_number: int, general_comments: List[Dict]) -> None:
         """Cache general comments for a specific PR."""
-        general_comments_data = self._load_json_file(self.general_comments_file)
+        self._store_pr_items("general_comments", repository, pr_number, general_comments)
 
-        if repository not in general_comments_data:
-            general_comments_data[repository] = {}
-
-        general_comments_data[repository][str(pr_number)] = general_comments
-        self._save_json_file(self.general_comments_file, general_comments_data)
+    def cache_many_general_comments(self, repository: str, general_comments_by_pr: Dict[int, List[Dict]]) -> None:
+        """Cache general comments for several PRs at once, keyed by PR number."""
+        self._store_many_pr_items("general_comments", repository, general_comments_by_pr)
 
     def get_cached_general_comments(self, repository: str, pr_number: int) -> List[Dict]:
         """Get cached general comments for a specific PR."""
-        general_comments_data = self._load_json_file(self.general_comments_file)
-        return general_comments_data.get(repository, {}).get(str(pr_number), [])
+        general_comments_data = self._load_json_file(self._repository_file(repository, "general_comments"))
+        return list(general_comments_data.get(str(pr_number), []))
 
     def clear_repository_cache(self, repository: str) -> None:
         """Clear all cached data for a repository."""
-        # Clear PRs
-        prs_data = self._load_json_file(self.prs_file)
-        if repository in prs_data:
-            del prs_data[repository]
-            self._save_json_file(self.prs_file, prs_data)
-
-        # Clear reviews
-        reviews_data = self._load_json_file(self.reviews_file)
-        if repository in reviews_data:
-            del reviews_data[repository]
-            self._save_json_file(self.reviews_file, reviews_data)
-
-        # Clear comments
-        comments_data = self._load_json_file(self.comments_file)
-        if repository in comments_data:
-            del comments_data[repository]
-            self._save_json_file(self.comments_file, comments_data)
-
-        # Clear review comments
-        review_comments_data = self._load_json_file(self.review_comments_file)
-        if repository in review_comments_data:
-            del review_comments_data[repository]
-            self._save_json_file(self.review_comments_file, review_comments_data)
-
-        # Clear general comments
-        general_comments_data = self._load_json_file(self.general_comments_file)
-        if repository in general_comments_data:
-            del general_comments_data[repository]
-            self._save_json_file(self.general_comments_file, general_comments_data)
+        repository_dir = self.repositories_dir / _safe_name(repository)
+        for kind in CACHE_KINDS:
+            file_path = self._repository_file(repository, kind)
+            self._documents.pop(file_path, None)
+            self._dirty.discard(file_path)
+
+        if repository_dir.exists():
+            shutil.rmtree(repository_dir)
 
         # Clear metadata
+        self._reset_latest_activity(repository)
         metadata = self.get_cache_metadata()
         if "repositories" in metadata and repository in metadata["repositories"]:
             del metadata["repositories"][repository]
             self._save_json_file(self.metadata_file, metadata)
 
+        self.flush()
+
     def clear_all_cache(self) -> None:
         """Clear all cached data."""
-        for file_path in [
-            self.metadata_file,
-            self.prs_file,
-            self.reviews_file,
-            self.comments_file,
-            self.review_comments_file,
-        ]:
-            if file_path.exists():
-                file_path.unlink()
+        self._documents.clear()
+        self._dirty.clear()
+
+        if self.metadata_file.exists():
+            self.metadata_file.unlink()
+        if self.repositories_dir.exists():
+            shutil.rmtree(self.repositories_dir)
+
+        # Stale ETags would otherwise replay old response bodies after the cache is cleared
+        for etag_file in self.cache_dir.glob(f"{ETAG_STORE_NAME}*"):
+            etag_file.unlink()
 
     def get_cache_size(self) -> Dict[str, int]:
         """Get cache size information."""
-        return {
-            name: file_path.stat().st_size if file_path.exists() else 0
-            for name, file_path in [
-                ("metadata", self.metadata_file),
-                ("pull_requests", self.prs_file),
-                ("reviews", self.reviews_file),
-                ("comments", self.comments_file),
-                ("review_comments", self.review_comments_file),
-            ]
-        }
+        try:
+            metadata_size = self.metadata_file.stat().st_size
+        except FileNotFoundError:
+            metadata_size = 0
+        sizes = {"metadata": metadata_size, **dict.fromkeys(CACHE_KINDS, 0)}
+        if not self.repositories_dir.is_dir():
+            return sizes
+
+        # One directory listing per repository; DirEntry caches what scandir already read
+        kind_by_name = {f"{kind}{DATA_FILE_SUFFIX}": kind for kind in CACHE_KINDS}
+        with os.scandir(self.repositories_dir) as repository_entries:
+            for repository_entry in repository_entries:
+                if not repository_entry.is_dir():
+                    continue
+                with os.scandir(repository_entry.path) as file_entries:
+                    for entry in file_entries:
+                        kind = kind_by_name.get(entry.name)
+                        if kind:
+                            sizes[kind] += entry.stat().st_size
+        return sizes
 
     def get_cached_repositories(self) -> List[str]:
         """Get list of cached repositories."""
@@ -234,57 +394,31 @@ class GitHubCache:
     def get_latest_pr_update_time(self, repository: str) -> Optional[str]:
         """Get the latest updated_at timestamp from cached PRs for a repository."""
         prs = self.get_cached_pull_requests(repository)
-        if not prs:
-            return None
-
-        # Find the latest updated_at timestamp
-        latest_time = None
-        for pr in prs:
-            updated_at = pr.get("updated_at")
-            if updated_at:
-                if latest_time is None or updated_at > latest_time:
-                    latest_time = updated_at
-
-        return latest_time
+        return _latest_timestamp(prs, ACTIVITY_FIELDS["pull_requests"])
 
     def get_latest_activity_time(self, repository: str) -> Optional[str]:
         """Get the latest activity timestamp from all cached data for a repository."""
-        latest_time = None
-
-        # Check PRs
-        pr_time = self.get_latest_pr_update_time(repository)
-        if pr_time and (latest_time is None or pr_time > latest_time):
-            latest_time = pr_time
-
-        # Check reviews
-        reviews_data = self._load_json_file(self.reviews_file)
-        repo_reviews = reviews_data.get(repository, {})
-        for pr_number, reviews in repo_reviews.items():
-            for review in reviews:
-                updated_at = review.get("submitted_at") or review.get("created_at")
-                if updated_at and (latest_time is None or updated_at > latest_time):
-                    latest_time = updated_at
-
-        # Check comments
-        comments_data = self._load_json_file(self.comments_file)
-        repo_comments = comments_data.get(repository, {})
-        for pr_number, comments in repo_comments.items():
-            for comment in comments:
-                updated_at = comment.get("updated_at") or comment.get("created_at")
-                if updated_at and (latest_time is None or updated_at > latest_time):
-                    latest_time = updated_at
-
-        # Check review comments
-        review_comments_data = self._load_json_file(self.review_comments_file)
-        repo_review_comments = review_comments_data.get(repository, {})
-        for pr_number, review_comments in repo_review_comments.items():
-            for review_comment in review_comments:
-                updated_at = review_comment.get("updated_at") or review_comment.get("created_at")
-                if updated_at and (latest_time is None or updated_at > latest_time):
-                    latest_time = updated_at
-
+        latest_activity = self._get_latest_activity_index()
+        if repository in latest_activity:
+            return latest_activity[repository]
+
+        latest_time = self._scan_latest_activity_time(repository)
+        if latest_time:
+            latest_activity[repository] = latest_time
+            self._save_json_file(self.metadata_file, self.get_cache_metadata())
         return latest_time
 
+    def _scan_latest_activity_time(self, repository: str) -> Optional[str]:
+        """Find the latest activity timestamp by scanning all cached data for a repository."""
+        latest_times = [self.get_latest_pr_update_time(repository)]
+
+        # Reviews, comments and review comments are stored as {pr_number: [items]}
+        for kind in ("reviews", "comments", "review_comments"):
+            repo_items = self._load_json_file(self._repository_file(repository, kind))
+            latest_times.append(_latest_timestamp(chain.from_iterable(repo_items.values()), ACTIVITY_FIELDS[kind]))
+
+        return max(filter(None, latest_times), default=None)
+
     def merge_pull_requests(self, repository: str, new_prs: List[Dict]) -> None:
         """Merge new PRs with existing cached PRs, updating existing ones and adding new ones."""
         existing_prs = self.get_cached_pull_requests(repository)
@@ -298,61 +432,35 @@ class GitHubCache:
             existing_prs_dict[pr_number] = new_pr
 
         # Convert back to list and sort by PR number
-        merged_prs = sorted(existing_prs_dict.values(), key=lambda pr: pr["number"], reverse=True)
+        merged_prs = sorted(existing_prs_dict.values(), key=itemgetter("number"), reverse=True)
 
         # Save merged data
-        self.cache_pull_requests(repository, merged_prs)
-
-    def merge_reviews(self, repository: str, pr_number: int, new_reviews: List[Dict]) -> None:
-        """Merge new reviews with existing cached reviews for a specific PR."""
-        existing_reviews = self.get_cached_reviews(repository, pr_number)
+        self._store_pull_requests(repository, merged_prs)
+        self._record_latest_activity(repository, "pull_requests", new_prs)
 
-        # Create a dictionary for quick lookup by review ID
-        existing_reviews_dict = {review["id"]: review for review in existing_reviews}
+    def _merge_pr_items(self, kind: str, repository: str, pr_number: int, new_items: List[Dict]) -> None:
+        """Merge new items into the cached ones for a PR, with a single load of the file."""
+        file_path = self._repository_file(repository, kind)
+        data = self._load_json_file(file_path)
+        pr_key = str(pr_number)
 
-        # Update existing reviews and add new ones
-        for new_review in new_reviews:
-            review_id = new_review["id"]
-            existing_reviews_dict[review_id] = new_review
+        # Create a dictionary for quick lookup by ID, then update existing items and add new ones
+        merged = {item["id"]: item for item in data.get(pr_key, [])}
+        merged.update((item["id"], item) for item in new_items)
 
-        # Convert back to list and sort by ID
-        merged_reviews = sorted(existing_reviews_dict.values(), key=lambda review: review["id"])
+        # Convert back to list sorted by ID and save
+        data[pr_key] = sorted(merged.values(), key=itemgetter("id"))
+        self._save_json_file(file_path, data)
+        self._record_latest_activity(repository, kind, new_items)
 
-        # Save merged data
-        self.cache_reviews(repository, pr_number, merged_reviews)
+    def merge_reviews(self, repository: str, pr_number: int, new_reviews: List[Dict]) -> None:
+        """Merge new reviews with existing cached reviews for a specific PR."""
+        self._merge_pr_items("reviews", repository, pr_number, new_reviews)
 
     def merge_comments(self, repository: str, pr_number: int, new_comments: List[Dict]) -> None:
         """Merge new comments with existing cached comments for a specific PR."""
-        existing_comments = self.get_cached_comments(repository, pr_number)
-
-        # Create a dictionary for quick lookup by comment ID
-        existing_comments_dict = {comment["id"]: comment for comment in existing_comments}
-
-        # Update existing comments and add new ones
-        for new_comment in new_comments:
-            comment_id = new_comment["id"]
-            existing_comments_dict[comment_id] = new_comment
-
-        # Convert back to list and sort by ID
-        merged_comments = sorted(existing_comments_dict.values(), key=lambda comment: comment["id"])
-
-        # Save merged data
-        self.cache_comments(repository, pr_number, merged_comments)
+        self._merge_pr_items("comments", repository, pr_number, new_comments)
 
     def merge_review_comments(self, repository: str, pr_number: int, new_review_comments: List[Dict]) -> None:
         """Merge new review comments with existing cached review comments for a specific PR."""
-        existing_review_comments = self.get_cached_review_comments(repository, pr_number)
-
-        # Create a dictionary for quick lookup by comment ID
-        existing_review_comments_dict = {comment["id"]: comment for comment in existing_review_comments}
-
-        # Update existing review comments and add new ones
-        for new_review_comment in new_review_comments:
-            comment_id = new_review_comment["id"]
-            existing_review_comments_dict[comment_id] = new_review_comment
-
-        # Convert back to list and sort by ID
-        merged_review_comments = sorted(existing_review_comments_dict.values(), key=lambda comment: comment["id"])
-
-        # Save merged data
-        self.cache_review_comments(repository, pr_number, merged_review_comments)
+        self._merge_pr_items("review_comments", repository, pr_number, new_review_comments)
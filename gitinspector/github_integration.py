@@ -11,18 +11,112 @@ Fetches Pull Request data from GitHub repositories including:
 
 import os
 import sys
-import base64
+import dbm
+import functools
+import hashlib
 import json
+import shelve
+import statistics
+import tempfile
+import threading
 import time
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding
 import jwt
-from .github_cache import GitHubCache, GitHubCacheError
+from .github_cache import ETAG_STORE_NAME, GitHubCache, GitHubCacheError
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; requests' stdlib-based decoding is used without it
+    orjson = None
+
+
+# Number of PRs whose reviews and comments are fetched from the API concurrently
+API_FETCH_WORKERS = 8
+
+# Remaining API requests below which requests are spaced out over the rest of the rate limit window
+RATE_LIMIT_PACING_THRESHOLD = 500
+
+# Remaining API requests below which we wait for the rate limit window to reset
+RATE_LIMIT_MIN_REMAINING = 10
+
+# Most responses kept in the ETag store; new responses are not stored beyond it, and a store
+# found full when opened is started afresh, which also drops space left by overwritten entries
+ETAG_STORE_MAX_ENTRIES = 50000
+
+# Number of repositories analysed from the API concurrently
+REPOSITORY_WORKERS = 4
+
+# Seconds before expiry at which a cached app JWT is replaced
+JWT_EXPIRY_MARGIN_SECONDS = 30
+
+# Time before expiry at which a cached installation token is replaced, so it cannot lapse mid-request
+INSTALLATION_TOKEN_EXPIRY_MARGIN = timedelta(seconds=60)
+
+# File where installation tokens are kept between runs, keyed by app ID and then by repository owner
+# (or owner/repo for installations limited to selected repositories)
+INSTALLATION_TOKENS_PATH = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "gitinspector", "installation_tokens.json"
+)
+
+
+# Serialises progress lines printed by repositories analysed on worker threads
+_PROGRESS_LOCK = threading.Lock()
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+# Recently parsed GitHub timestamps kept by _parse_github_timestamp; nearly every timestamp is
+# unique, so only the few re-parsed soon after (e.g. a PR's created_at when filtering and again
+# when computing its duration) are worth keeping, and the cache must not grow with the run
+TIMESTAMP_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _parse_github_timestamp(timestamp: str) -> datetime:
+    """Parse a GitHub ISO 8601 timestamp ending in "Z" into an aware datetime."""
+    if not _FROMISOFORMAT_ACCEPTS_Z and timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    return datetime.fromisoformat(timestamp)
+
+
+def _new_user_stats() -> Dict[str, int]:
+    return {"prs_created": 0, "prs_merged": 0, "total_comments_received": 0, "total_reviews_received": 0}
+
+
+def _new_review_stats() -> Dict[str, int]:
+    return {"reviews_given": 0, "comments_given": 0}
+
+
+def _new_comment_stats() -> Dict[str, int]:
+    return {"comments_given": 0, "comments_received": 0}
+
+
+def _freeze_stats(analysis: Dict) -> None:
+    """Turn the defaultdict stats of a finished analysis back into plain dicts."""
+    for key in ("user_stats", "review_stats", "comment_stats"):
+        analysis[key] = dict(analysis[key])
+
+
+def _parse_date_bound(value: str, end_of_day: bool = False) -> datetime:
+    """
+    Parse a since/until bound into an aware datetime; a bare date like "2025-08-01" covers that
+    whole UTC day, and a date and time without a timezone is taken as UTC.
+    """
+    if "T" in value or "Z" in value:
+        bound = _parse_github_timestamp(value)
+        return bound if bound.tzinfo is not None else bound.replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(value + ("T23:59:59+00:00" if end_of_day else "T00:00:00+00:00"))
 
 
 class GitHubIntegrationError(Exception):
@@ -72,39 +166,84 @@ class GitHubIntegration:
             else:
                 raise GitHubIntegrationError("Either private_key_path or private_key_content must be provided")
 
-            # Initialize session
+            # Initialize session with a connection pool sized for the fetch worker threads and
+            # retries for transient server errors and secondary rate limits
             self.session = requests.Session()
+            retry = Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            pool_size = REPOSITORY_WORKERS * API_FETCH_WORKERS
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
             self.session.headers.update(
-                {"Accept": "application/vnd.github.v3+json", "User-Agent": "GitInspector-GitHub-Integration"}
+                {
+                    "Accept": "application/vnd.github.v3+json",
+                    "User-Agent": "GitInspector-GitHub-Integration",
+                    "X-GitHub-Api-Version": self.api_version,
+                }
             )
 
-            # Cache for installation tokens
-            self._installation_tokens = {}
+            # Cache for installation tokens, persisted so later runs can reuse unexpired tokens
+            self.installation_tokens_path = INSTALLATION_TOKENS_PATH
+            self._installation_tokens = None
+
+            # Parsed private key and the current app JWT, reused until shortly before it expires
+            self._private_key_obj = None
+            self._app_jwt = None
+            self._app_jwt_expires_at = 0
+
+            # ETag store for conditional requests, opened on first use and shared by worker threads
+            self.etag_store_path = os.path.join(cache_dir, ETAG_STORE_NAME)
+            self._etag_store = None
+            self._etag_lock = threading.Lock()
+
+            # Earliest time the next request may start when pacing against the rate limit
+            self._next_request_at = 0.0
+            self._rate_limit_lock = threading.Lock()
 
     def _create_jwt(self) -> str:
-        """Create a JWT token for GitHub App authentication."""
+        """Create a JWT token for GitHub App authentication, reusing the current one while it is valid."""
+        now = int(time.time())
+        if self._app_jwt and now < self._app_jwt_expires_at - JWT_EXPIRY_MARGIN_SECONDS:
+            return self._app_jwt
+
         try:
-            # Parse the private key
-            private_key = serialization.load_pem_private_key(self.private_key.encode("utf-8"), password=None)
+            # Parse the private key once
+            if self._private_key_obj is None:
+                self._private_key_obj = serialization.load_pem_private_key(
+                    self.private_key.encode("utf-8"), password=None
+                )
 
             # Create JWT payload
-            now = int(time.time())
             payload = {"iat": now, "exp": now + 600, "iss": self.app_id}  # 10 minutes
 
             # Sign the JWT
-            return jwt.encode(payload, private_key, algorithm="RS256")
+            self._app_jwt = jwt.encode(payload, self._private_key_obj, algorithm="RS256")
+            self._app_jwt_expires_at = payload["exp"]
+            return self._app_jwt
 
         except Exception as e:
             raise GitHubIntegrationError(f"Failed to create JWT: {str(e)}")
 
     def _get_installation_token(self, owner: str, repo: str) -> str:
         """Get installation token for a specific repository."""
-        cache_key = f"{owner}/{repo}"
+        # An app is installed once per account. A token of an installation with access to all of the
+        # owner's repositories is shared by every repo of that owner; one limited to selected
+        # repositories is kept for the repository it was minted for, as it may not cover the others
+        if self._installation_tokens is None:
+            self._installation_tokens = self._load_installation_tokens()
 
         # Check if we have a cached token that's still valid
-        if cache_key in self._installation_tokens:
-            token_data = self._installation_tokens[cache_key]
-            if token_data["expires_at"] > datetime.now(timezone.utc):
+        usable_after = datetime.now(timezone.utc) + INSTALLATION_TOKEN_EXPIRY_MARGIN
+        for cache_key in (owner, f"{owner}/{repo}"):
+            token_data = self._installation_tokens.get(cache_key)
+            if token_data and token_data["expires_at"] > usable_after:
                 return token_data["token"]
 
         # Create JWT for app authentication
@@ -128,64 +267,217 @@ class GitHubIntegration:
             raise GitHubIntegrationError(f"Failed to get installation token: {response.status_code} - {response.text}")
 
         token_data = response.json()
-        expires_at = datetime.fromisoformat(token_data["expires_at"].replace("Z", "+00:00"))
+        expires_at = _parse_github_timestamp(token_data["expires_at"])
 
         # Cache the token
+        cache_key = owner if token_data.get("repository_selection") == "all" else f"{owner}/{repo}"
         self._installation_tokens[cache_key] = {"token": token_data["token"], "expires_at": expires_at}
+        self._save_installation_tokens()
 
         return token_data["token"]
 
+    def _load_installation_tokens(self) -> Dict[str, Dict]:
+        """Load this app's unexpired installation tokens saved by earlier runs."""
+        try:
+            with open(self.installation_tokens_path, "r", encoding="utf-8") as f:
+                saved_tokens = json.load(f).get(str(self.app_id), {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+        # Tokens that would expire during this run are not worth loading
+        usable_after = datetime.now(timezone.utc) + INSTALLATION_TOKEN_EXPIRY_MARGIN
+        tokens = {}
+        for cache_key, token_data in saved_tokens.items():
+            try:
+                expires_at = datetime.fromisoformat(token_data["expires_at"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if expires_at > usable_after:
+                tokens[cache_key] = {"token": token_data["token"], "expires_at": expires_at}
+        return tokens
+
+    def _save_installation_tokens(self) -> None:
+        """Save this app's unexpired installation tokens, readable only by the current user."""
+        try:
+            with open(self.installation_tokens_path, "r", encoding="utf-8") as f:
+                all_tokens = json.load(f)
+        except (OSError, ValueError):
+            all_tokens = {}
+        if not isinstance(all_tokens, dict):
+            all_tokens = {}
+
+        now = datetime.now(timezone.utc)
+        all_tokens[str(self.app_id)] = {
+            cache_key: {"token": token_data["token"], "expires_at": token_data["expires_at"].isoformat()}
+            # Snapshot the items; other repositories may be minting tokens on worker threads
+            for cache_key, token_data in list(self._installation_tokens.items())
+            if token_data["expires_at"] > now
+        }
+
+        # Tokens are bearer credentials: write through a private temp file, then replace atomically
+        directory = os.path.dirname(self.installation_tokens_path)
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(all_tokens, f)
+            os.replace(temp_path, self.installation_tokens_path)
+        except OSError as e:
+            # Persisting is an optimization; the token in memory is still valid
+            print(f"Warning: Could not save installation tokens: {e}", file=sys.stderr)
+
     def _make_authenticated_request(self, owner: str, repo: str, endpoint: str, params: Dict = None) -> Dict:
         """Make an authenticated request to GitHub API."""
+        url = f"{self.api_base_url}/repos/{owner}/{repo}/{endpoint}"
+        data, _ = self._get_authenticated_page(owner, repo, url, params)
+        return data
+
+    def _get_authenticated_page(
+        self, owner: str, repo: str, url: str, params: Dict = None
+    ) -> Tuple[object, Dict[str, str]]:
+        """
+        Make an authenticated GET request to a GitHub API URL.
+
+        Responses are revalidated with their ETag, so unchanged data is served from the
+        local ETag store and does not count against the rate limit.
+
+        Returns:
+            Tuple of (decoded JSON body, pagination URLs from the Link header keyed by rel)
+        """
         token = self._get_installation_token(owner, repo)
         headers = {"Authorization": f"token {token}"}
 
-        url = f"{self.api_base_url}/repos/{owner}/{repo}/{endpoint}"
+        etag_key = self._etag_key(url, params)
+        cached = self._get_etag_entry(etag_key)
+        if cached and "links" in cached:
+            headers["If-None-Match"] = cached["etag"]
+
         response = self.session.get(url, headers=headers, params=params)
 
+        if response.status_code == 304 and "If-None-Match" in headers:
+            self._wait_for_rate_limit(response)
+            return cached["body"], cached["links"]
+
         if response.status_code != 200:
             raise GitHubIntegrationError(f"GitHub API request failed: {response.status_code} - {response.text}")
 
-        return response.json()
+        self._wait_for_rate_limit(response)
+        # Decode the raw (already decompressed) bytes directly when orjson is available
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+        links = {rel: link["url"] for rel, link in response.links.items()}
+        if etag := response.headers.get("ETag"):
+            self._set_etag_entry(etag_key, {"etag": etag, "body": data, "links": links})
+        return data, links
+
+    @staticmethod
+    def _etag_key(url: str, params: Dict = None) -> str:
+        """Build the ETag store key for a request URL and its query parameters."""
+        query = json.dumps(params or {}, sort_keys=True)
+        return hashlib.sha1(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+    def _get_etag_entry(self, key: str) -> Optional[Dict]:
+        """Get the stored ETag and body for a request, opening the ETag store on first use."""
+        with self._etag_lock:
+            if self._etag_store is None and self.etag_store_path:
+                try:
+                    os.makedirs(os.path.dirname(self.etag_store_path), exist_ok=True)
+                    self._etag_store = shelve.open(self.etag_store_path)
+                    if len(self._etag_store) >= ETAG_STORE_MAX_ENTRIES:
+                        self._etag_store.close()
+                        self._etag_store = shelve.open(self.etag_store_path, flag="n")
+                except dbm.error as e:  # includes OSError
+                    # Revalidation is an optimization; requests still work without the store
+                    print(f"Warning: Could not open ETag store: {e}", file=sys.stderr)
+                    self.etag_store_path = None
+            return self._etag_store.get(key) if self._etag_store is not None else None
+
+    def _set_etag_entry(self, key: str, entry: Dict) -> None:
+        """Store the ETag and body of a successful response."""
+        with self._etag_lock:
+            if self._etag_store is None:
+                return
+            if key not in self._etag_store and len(self._etag_store) >= ETAG_STORE_MAX_ENTRIES:
+                return
+            try:
+                self._etag_store[key] = entry
+            except dbm.error as e:
+                print(f"Warning: Could not update ETag store: {e}", file=sys.stderr)
+
+    def close(self) -> None:
+        """Write out and close the ETag store; it is reopened if the integration is used again."""
+        if self.use_cache:
+            return
+        with self._etag_lock:
+            if self._etag_store is not None:
+                self._etag_store.close()
+                self._etag_store = None
+
+    def __enter__(self) -> "GitHubIntegration":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _wait_for_rate_limit(self, response: requests.Response) -> None:
+        """
+        Pace requests by the rate limit budget reported in a response.
+
+        Well within budget requests are not delayed. Once fewer than RATE_LIMIT_PACING_THRESHOLD
+        requests remain, they are spread evenly over the rest of the window, and when the budget
+        is nearly exhausted we wait for the window to reset.
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None or int(remaining) >= RATE_LIMIT_PACING_THRESHOLD:
+            return
+
+        remaining = int(remaining)
+        reset_at = response.headers.get("X-RateLimit-Reset")
+        seconds_to_reset = int(reset_at) - time.time() if reset_at else 60
+
+        if remaining < RATE_LIMIT_MIN_REMAINING:
+            if seconds_to_reset > 0:
+                print(f"  Rate limit nearly exhausted, waiting {seconds_to_reset:.0f}s for reset", file=sys.stderr)
+                time.sleep(seconds_to_reset)
+            return
+
+        # Reserve the next slot; slots are shared by all worker threads
+        gap = max(seconds_to_reset, 0) / remaining
+        with self._rate_limit_lock:
+            now = time.time()
+            start = max(now, self._next_request_at)
+            self._next_request_at = start + gap
+        if start > now:
+            time.sleep(start - now)
 
     def _filter_cached_prs(self, prs: List[Dict], state: str, since: str = None, until: str = None) -> List[Dict]:
-        """Filter cached PRs by state, since date, and until date."""
+        """Filter PRs, cached or fetched, by state and by creation between the since and until dates."""
         filtered_prs = []
 
+        # Parse the bounds once rather than for every PR
+        try:
+            since_date = _parse_date_bound(since) if since else None
+        except ValueError:
+            raise GitHubIntegrationError(f"Invalid since date: {since}")
+        try:
+            until_date = _parse_date_bound(until, end_of_day=True) if until else None
+        except ValueError:
+            raise GitHubIntegrationError(f"Invalid until date: {until}")
+
         for pr in prs:
             # Filter by state
             if state != "all" and pr.get("state") != state:
                 continue
 
             # Filter by date range - convert to datetime for proper comparison
-            if since or until:
+            if since_date or until_date:
                 try:
-                    from datetime import datetime, timezone
-
-                    pr_created_str = pr.get("created_at", "")
-                    pr_created = datetime.fromisoformat(pr_created_str.replace("Z", "+00:00"))
-
-                    # Parse since date and make it timezone-aware (assume UTC if no timezone)
-                    if since:
-                        if "T" in since or "Z" in since:
-                            since_date = datetime.fromisoformat(since.replace("Z", "+00:00"))
-                        else:
-                            # If it's just a date like "2025-08-01", assume UTC midnight
-                            since_date = datetime.fromisoformat(since + "T00:00:00+00:00")
-
-                        if pr_created < since_date:
-                            continue
+                    pr_created = _parse_github_timestamp(pr.get("created_at", ""))
 
-                    # Parse until date and make it timezone-aware (assume UTC if no timezone)
-                    if until:
-                        if "T" in until or "Z" in until:
-                            until_date = datetime.fromisoformat(until.replace("Z", "+00:00"))
-                        else:
-                            # If it's just a date like "2025-08-01", assume UTC end of day
-                            until_date = datetime.fromisoformat(until + "T23:59:59+00:00")
+                    if since_date and pr_created < since_date:
+                        continue
 
-                        if pr_created > until_date:
-                            continue
+                    if until_date and pr_created > until_date:
+                        continue
 
                 except (ValueError, TypeError):
                     # If date parsing fails, skip this PR
@@ -196,31 +488,53 @@ class GitHubIntegration:
         return filtered_prs
 
     def _fetch_prs_from_api(self, owner: str, repo: str, state: str, since: str = None) -> List[Dict]:
-        """Fetch PRs from GitHub API."""
+        """Fetch PRs from GitHub API, limited to those updated at or after since when it is given."""
         params = {"state": state, "per_page": 100}
+        since_date = None
         if since:
-            params["since"] = since
+            # /pulls has no since filter; list the most recently updated PRs first and stop paging
+            # once past since. Every PR created after since was also updated after it.
+            params.update(sort="updated", direction="desc")
+            try:
+                since_date = _parse_date_bound(since)
+            except ValueError:
+                raise GitHubIntegrationError(f"Invalid since date: {since}")
 
-        prs = []
-        page = 1
+        url = f"{self.api_base_url}/repos/{owner}/{repo}/pulls"
+        data, links = self._get_authenticated_page(owner, repo, url, params)
+
+        if since_date is None and "last" in links:
+            # The first page links to the last one, so the remaining pages are known up front
+            return data + self._fetch_remaining_pages(owner, repo, url, params, links["last"])
 
+        prs = []
         while True:
-            params["page"] = page
-            data = self._make_authenticated_request(owner, repo, "pulls", params)
+            if since_date is None:
+                prs.extend(data)
+            else:
+                recent_prs = [pr for pr in data if _parse_github_timestamp(pr["updated_at"]) >= since_date]
+                prs.extend(recent_prs)
+                if len(recent_prs) < len(data):
+                    break
 
-            if not data:  # No more PRs
+            if "next" not in links:
                 break
+            # The next page URL from the Link header already carries the query parameters
+            data, links = self._get_authenticated_page(owner, repo, links["next"])
 
-            prs.extend(data)
-            page += 1
+        return prs
 
-            # Rate limiting - be respectful
-            if "X-RateLimit-Remaining" in self.session.headers:
-                remaining = int(self.session.headers["X-RateLimit-Remaining"])
-                if remaining < 10:
-                    time.sleep(60)  # Wait a minute if rate limit is low
+    def _fetch_remaining_pages(self, owner: str, repo: str, url: str, params: Dict, last_url: str) -> List[Dict]:
+        """Fetch pages 2 through the one of last_url concurrently, returning their items in page order."""
+        last_page = int(parse_qs(urlparse(last_url).query)["page"][0])
+        page_params = [dict(params, page=page) for page in range(2, last_page + 1)]
 
-        return prs
+        def fetch_page(page_param: Dict) -> List[Dict]:
+            data, _ = self._get_authenticated_page(owner, repo, url, page_param)
+            return data
+
+        with ThreadPoolExecutor(max_workers=API_FETCH_WORKERS) as executor:
+            return list(chain.from_iterable(executor.map(fetch_page, page_params)))
 
     def get_pull_requests(
         self, owner: str, repo: str, state: str = "all", since: str = None, until: str = None
@@ -246,12 +560,24 @@ class GitHubIntegration:
             if cached_prs is not None:
                 return self._filter_cached_prs(cached_prs, state, since, until)
 
-        # If not using cache, fetch from API
+        # If not using cache, fetch from API; every PR created after since was also updated after it,
+        # so the listing of recently updated PRs is narrowed to the same PRs the cache would give
         if not self.use_cache:
-            return self._fetch_prs_from_api(owner, repo, state, since)
+            return self._filter_cached_prs(self._fetch_prs_from_api(owner, repo, state, since), state, since, until)
 
         raise GitHubIntegrationError(f"No cached data available for {repository}. Run the sync script first.")
 
+    def get_updated_pull_requests(self, owner: str, repo: str, since: str = None, state: str = "all") -> List[Dict]:
+        """
+        Get pull requests updated at or after since from the GitHub API, for syncing the cache.
+
+        Unlike get_pull_requests, PRs are selected by update time rather than creation time, so an
+        incremental sync also picks up older PRs that changed since the last sync.
+        """
+        if self.use_cache:
+            raise GitHubIntegrationError("Updated pull requests can only be fetched from the API")
+        return self._fetch_prs_from_api(owner, repo, state, since)
+
     def get_pr_reviews(self, owner: str, repo: str, pr_number: int) -> List[Dict]:
         """Get reviews for a specific pull request."""
         repository = f"{owner}/{repo}"
@@ -362,6 +688,7 @@ class GitHubIntegration:
 
         # Calculate final statistics
         self._calculate_final_statistics(analysis)
+        _freeze_stats(analysis)
 
         return analysis
 
@@ -378,9 +705,9 @@ class GitHubIntegration:
             "closed_prs": 0,
             "merged_prs": 0,
             "pr_durations": [],
-            "user_stats": {},
-            "review_stats": {},
-            "comment_stats": {},
+            "user_stats": defaultdict(_new_user_stats),
+            "review_stats": defaultdict(_new_review_stats),
+            "comment_stats": defaultdict(_new_comment_stats),
         }
 
     def _process_prs(self, owner: str, repo: str, prs: List[Dict], analysis: Dict) -> None:
@@ -388,22 +715,37 @@ class GitHubIntegration:
         total_prs = len(prs)
         analysis["total_prs"] = total_prs
 
-        for i, pr in enumerate(prs, 1):
-            self._show_progress(i, total_prs)
-            self._process_single_pr(owner, repo, pr, analysis)
-            self._apply_rate_limiting()
+        if self.use_cache:
+            # Cached data is read locally, so there is no API to rate limit
+            for i, pr in enumerate(prs, 1):
+                self._show_progress(i, total_prs, f"{owner}/{repo}")
+                self._process_single_pr(owner, repo, pr, analysis)
+            return
 
-    def _apply_rate_limiting(self) -> None:
-        """Apply rate limiting between PR processing."""
-        time.sleep(0.1)  # Rate limiting
+        # Fetch reviews and comments for several PRs at once; the requests are
+        # network bound, while aggregation stays on this thread in PR order
+        with ThreadPoolExecutor(max_workers=API_FETCH_WORKERS) as executor:
+            futures = [executor.submit(self._fetch_pr_related_data, owner, repo, pr["number"]) for pr in prs]
+            try:
+                for i, (pr, future) in enumerate(zip(prs, futures), 1):
+                    self._show_progress(i, total_prs, f"{owner}/{repo}")
+                    self._process_single_pr(owner, repo, pr, analysis, future.result())
+            except BaseException:
+                # Don't spend requests on PRs whose results would be thrown away; only the
+                # fetches already running are waited for (cancel_futures needs Python 3.9)
+                for future in futures:
+                    future.cancel()
+                raise
 
-    def _show_progress(self, current: int, total: int) -> None:
-        """Show progress for PR processing."""
+    def _show_progress(self, current: int, total: int, repository: str = None) -> None:
+        """Show progress for PR processing, labelled with the repository when given."""
         if current % 10 == 0 or current == total:
-            print(f"  Processing PR {current}/{total} ({(current/total)*100:.1f}%)", file=os.sys.stderr)
+            label = f"{repository}: " if repository else ""
+            with _PROGRESS_LOCK:
+                print(f"  {label}Processing PR {current}/{total} ({(current/total)*100:.1f}%)", file=os.sys.stderr)
 
-    def _process_single_pr(self, owner: str, repo: str, pr: Dict, analysis: Dict) -> None:
-        """Process a single PR and update analysis data."""
+    def _process_single_pr(self, owner: str, repo: str, pr: Dict, analysis: Dict, pr_data: Dict = None) -> None:
+        """Process a single PR and update analysis data, fetching its reviews and comments unless given."""
         # Process basic PR information
         self._process_pr_basic_info(pr, analysis)
 
@@ -411,7 +753,8 @@ class GitHubIntegration:
         self._process_pr_user_stats(pr, analysis)
 
         # Get and process reviews and comments
-        pr_data = self._fetch_pr_related_data(owner, repo, pr["number"])
+        if pr_data is None:
+            pr_data = self._fetch_pr_related_data(owner, repo, pr["number"])
         self._process_pr_related_data(pr, pr_data, analysis)
 
     def _fetch_pr_related_data(self, owner: str, repo: str, pr_number: int) -> Dict:
@@ -444,91 +787,72 @@ class GitHubIntegration:
         """Process basic PR information (state, duration)."""
         if pr["state"] == "open":
             analysis["open_prs"] += 1
-        elif pr["merged_at"]:
+        elif merged_at := pr["merged_at"]:
             analysis["merged_prs"] += 1
-            duration_hours = self._calculate_pr_duration(pr)
+            duration_hours = self._calculate_pr_duration(pr, merged_at)
             analysis["pr_durations"].append(duration_hours)
         else:
             analysis["closed_prs"] += 1
 
-    def _calculate_pr_duration(self, pr: Dict) -> float:
+    def _calculate_pr_duration(self, pr: Dict, merged_at: str = None) -> float:
         """Calculate PR duration in hours."""
-        created_at = datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00"))
-        merged_at = datetime.fromisoformat(pr["merged_at"].replace("Z", "+00:00"))
+        created_at = _parse_github_timestamp(pr["created_at"])
+        merged_at = _parse_github_timestamp(merged_at or pr["merged_at"])
         return (merged_at - created_at).total_seconds() / 3600
 
     def _process_pr_user_stats(self, pr: Dict, analysis: Dict) -> None:
         """Process user statistics for a PR."""
-        author = pr["user"]["login"]
-        self._ensure_user_in_stats(author, analysis["user_stats"])
-
-        analysis["user_stats"][author]["prs_created"] += 1
+        author_stats = analysis["user_stats"][pr["user"]["login"]]
+        author_stats["prs_created"] += 1
         if pr["merged_at"]:
-            analysis["user_stats"][author]["prs_merged"] += 1
+            author_stats["prs_merged"] += 1
 
     def _ensure_user_in_stats(self, user: str, user_stats: Dict) -> None:
         """Ensure user exists in user_stats with default values."""
         if user not in user_stats:
-            user_stats[user] = {
-                "prs_created": 0,
-                "prs_merged": 0,
-                "total_comments_received": 0,
-                "total_reviews_received": 0,
-            }
+            user_stats[user] = _new_user_stats()
 
     def _process_review_stats(self, reviews: List[Dict], analysis: Dict) -> None:
         """Process review statistics."""
-        for review in reviews:
-            reviewer = review["user"]["login"]
-            if reviewer not in analysis["review_stats"]:
-                analysis["review_stats"][reviewer] = {"reviews_given": 0, "comments_given": 0}
-            analysis["review_stats"][reviewer]["reviews_given"] += 1
+        review_stats = analysis["review_stats"]
+        comment_stats = analysis["comment_stats"]
+        for reviewer, review_count in Counter(review["user"]["login"] for review in reviews).items():
+            reviewer_stats = review_stats[reviewer]
+            reviewer_stats["reviews_given"] += review_count
 
             # Count comments given by this reviewer
-            if reviewer in analysis["comment_stats"]:
-                analysis["review_stats"][reviewer]["comments_given"] = analysis["comment_stats"][reviewer][
-                    "comments_given"
-                ]
+            if reviewer in comment_stats:
+                reviewer_stats["comments_given"] = comment_stats[reviewer]["comments_given"]
 
     def _process_comment_stats(
         self, pr: Dict, comments: List[Dict], review_comments: List[Dict], general_comments: List[Dict], analysis: Dict
     ) -> None:
         """Process comment statistics."""
         author = pr["user"]["login"]
-        all_comments = comments + review_comments + general_comments
-
-        # Process individual comments
-        for comment in all_comments:
-            commenter = comment["user"]["login"]
-            self._ensure_commenter_in_stats(commenter, analysis)
-            analysis["comment_stats"][commenter]["comments_given"] += 1
 
-        # Update comments received for PR author
-        self._update_author_comment_stats(author, all_comments, analysis)
+        # Tally comments per commenter; commenters are listed in user_stats too, while
+        # comment_stats entries are created on first use
+        user_stats = analysis["user_stats"]
+        comment_stats = analysis["comment_stats"]
+        all_comments = chain(comments, review_comments, general_comments)
+        for commenter, comments_given in Counter(comment["user"]["login"] for comment in all_comments).items():
+            self._ensure_user_in_stats(commenter, user_stats)
+            comment_stats[commenter]["comments_given"] += comments_given
 
-    def _ensure_commenter_in_stats(self, commenter: str, analysis: Dict) -> None:
-        """Ensure commenter exists in both comment_stats and user_stats."""
-        if commenter not in analysis["comment_stats"]:
-            analysis["comment_stats"][commenter] = {"comments_given": 0, "comments_received": 0}
+        # Update comments received for PR author, once for all of the PR's comments
+        comment_count = len(comments) + len(review_comments) + len(general_comments)
+        self._update_author_comment_stats(author, comment_count, analysis)
 
-        self._ensure_user_in_stats(commenter, analysis["user_stats"])
-
-    def _update_author_comment_stats(self, author: str, all_comments: List[Dict], analysis: Dict) -> None:
+    def _update_author_comment_stats(self, author: str, comment_count: int, analysis: Dict) -> None:
         """Update comment statistics for PR author."""
-        # Ensure author exists in user_stats
-        self._ensure_user_in_stats(author, analysis["user_stats"])
-
-        analysis["user_stats"][author]["total_comments_received"] += len(all_comments)
-
-        if author not in analysis["comment_stats"]:
-            analysis["comment_stats"][author] = {"comments_given": 0, "comments_received": 0}
-        analysis["comment_stats"][author]["comments_received"] += len(all_comments)
+        analysis["user_stats"][author]["total_comments_received"] += comment_count
+        analysis["comment_stats"][author]["comments_received"] += comment_count
 
     def _calculate_final_statistics(self, analysis: Dict) -> None:
         """Calculate final statistics (averages, medians)."""
         if analysis["pr_durations"]:
-            analysis["avg_pr_duration_hours"] = sum(analysis["pr_durations"]) / len(analysis["pr_durations"])
-            analysis["median_pr_duration_hours"] = sorted(analysis["pr_durations"])[len(analysis["pr_durations"]) // 2]
+            analysis["avg_pr_duration_hours"] = statistics.fmean(analysis["pr_durations"])
+            analysis["median_pr_duration_hours"] = statistics.median(analysis["pr_durations"])
         else:
             analysis["avg_pr_duration_hours"] = 0
             analysis["median_pr_duration_hours"] = 0
@@ -557,6 +881,7 @@ class GitHubIntegration:
 
         # Calculate final combined statistics
         self._calculate_combined_statistics(combined_analysis)
+        _freeze_stats(combined_analysis)
 
         # Cache the results for future use
         self._cache_analysis_results(repositories, since, until, combined_analysis)
@@ -584,13 +909,12 @@ class GitHubIntegration:
 
     def _get_cache_timestamps(self, repositories: List[str]) -> Dict[str, str]:
         """Get cache timestamps for the given repositories."""
+        cached_repositories = self.cache.get_cache_metadata().get("repositories", {})
         cache_timestamps = {}
         for repo in repositories:
-            if self.cache.is_repository_cached(repo):
-                all_metadata = self.cache.get_cache_metadata()
-                repo_metadata = all_metadata.get("repositories", {}).get(repo, {})
-                if repo_metadata and "last_sync" in repo_metadata:
-                    cache_timestamps[repo] = repo_metadata["last_sync"]
+            repo_metadata = cached_repositories.get(repo)
+            if repo_metadata and "last_sync" in repo_metadata:
+                cache_timestamps[repo] = repo_metadata["last_sync"]
         return cache_timestamps
 
     def _initialize_combined_analysis_structure(self, total_repositories: int) -> Dict:
@@ -606,24 +930,42 @@ class GitHubIntegration:
                 "total_reviews": 0,
                 "total_comments": 0,
             },
-            "user_stats": {},
-            "review_stats": {},
-            "comment_stats": {},
+            "user_stats": defaultdict(_new_user_stats),
+            "review_stats": defaultdict(_new_review_stats),
+            "comment_stats": defaultdict(_new_comment_stats),
         }
 
     def _process_repositories(self, repositories: List[str], since: str, until: str, combined_analysis: Dict) -> None:
         """Process all repositories and aggregate their analysis data."""
-        for repo in repositories:
-            try:
-                owner, repo_name = repo.split("/", 1)
-                analysis = self.analyze_repository_prs(owner, repo_name, since, until)
+        analyze = functools.partial(self._analyze_repository_safely, since=since, until=until)
 
-                combined_analysis["repositories"][repo] = analysis
-                self._aggregate_repository_analysis(analysis, combined_analysis)
+        # Cached analyses are CPU bound and run serially; API analyses mostly wait on the
+        # network, so several repositories are analysed at once
+        if self.use_cache:
+            self._aggregate_repository_results(repositories, map(analyze, repositories), combined_analysis)
+            return
+
+        with ThreadPoolExecutor(max_workers=REPOSITORY_WORKERS) as executor:
+            self._aggregate_repository_results(repositories, executor.map(analyze, repositories), combined_analysis)
 
-            except Exception as e:
-                print(f"Error analyzing repository {repo}: {str(e)}", file=os.sys.stderr)
+    def _analyze_repository_safely(self, repo: str, since: str, until: str) -> Optional[Dict]:
+        """Analyze one "owner/repo" repository, reporting errors instead of raising them."""
+        try:
+            owner, repo_name = repo.split("/", 1)
+            return self.analyze_repository_prs(owner, repo_name, since, until)
+        except Exception as e:
+            print(f"Error analyzing repository {repo}: {str(e)}", file=os.sys.stderr)
+            return None
+
+    def _aggregate_repository_results(
+        self, repositories: List[str], analyses: Iterable[Optional[Dict]], combined_analysis: Dict
+    ) -> None:
+        """Aggregate repository analyses, in repository order, skipping those that failed."""
+        for repo, analysis in zip(repositories, analyses):
+            if analysis is None:
                 continue
+            combined_analysis["repositories"][repo] = analysis
+            self._aggregate_repository_analysis(analysis, combined_analysis)
 
     def _aggregate_repository_analysis(self, analysis: Dict, combined_analysis: Dict) -> None:
         """Aggregate a single repository's analysis into the combined analysis."""
@@ -647,55 +989,44 @@ class GitHubIntegration:
 
     def _aggregate_user_stats(self, analysis: Dict, combined_analysis: Dict) -> None:
         """Aggregate user statistics."""
+        combined_user_stats = combined_analysis["user_stats"]
         for user, stats in analysis["user_stats"].items():
-            if user not in combined_analysis["user_stats"]:
-                combined_analysis["user_stats"][user] = {
-                    "prs_created": 0,
-                    "prs_merged": 0,
-                    "total_comments_received": 0,
-                    "total_reviews_received": 0,
-                }
-
-            combined_analysis["user_stats"][user]["prs_created"] += stats["prs_created"]
-            combined_analysis["user_stats"][user]["prs_merged"] += stats["prs_merged"]
-            combined_analysis["user_stats"][user]["total_comments_received"] += stats["total_comments_received"]
-            combined_analysis["user_stats"][user]["total_reviews_received"] += stats["total_reviews_received"]
+            user_totals = combined_user_stats[user]
+            user_totals["prs_created"] += stats["prs_created"]
+            user_totals["prs_merged"] += stats["prs_merged"]
+            user_totals["total_comments_received"] += stats["total_comments_received"]
+            user_totals["total_reviews_received"] += stats["total_reviews_received"]
 
     def _aggregate_review_stats(self, analysis: Dict, combined_analysis: Dict) -> None:
         """Aggregate review statistics."""
+        combined_review_stats = combined_analysis["review_stats"]
+        total_reviews = 0
         for user, stats in analysis["review_stats"].items():
-            if user not in combined_analysis["review_stats"]:
-                combined_analysis["review_stats"][user] = {"reviews_given": 0, "comments_given": 0}
-
-            combined_analysis["review_stats"][user]["reviews_given"] += stats["reviews_given"]
-            combined_analysis["review_stats"][user]["comments_given"] += stats["comments_given"]
+            review_totals = combined_review_stats[user]
+            review_totals["reviews_given"] += stats["reviews_given"]
+            review_totals["comments_given"] += stats["comments_given"]
+            total_reviews += stats["reviews_given"]
+        combined_analysis["overall_stats"]["total_reviews"] += total_reviews
 
     def _aggregate_comment_stats(self, analysis: Dict, combined_analysis: Dict) -> None:
         """Aggregate comment statistics."""
+        combined_comment_stats = combined_analysis["comment_stats"]
+        total_comments = 0
         for user, stats in analysis["comment_stats"].items():
-            if user not in combined_analysis["comment_stats"]:
-                combined_analysis["comment_stats"][user] = {"comments_given": 0, "comments_received": 0}
-
-            combined_analysis["comment_stats"][user]["comments_given"] += stats["comments_given"]
-            combined_analysis["comment_stats"][user]["comments_received"] += stats["comments_received"]
+            comment_totals = combined_comment_stats[user]
+            comment_totals["comments_given"] += stats["comments_given"]
+            comment_totals["comments_received"] += stats["comments_received"]
+            total_comments += stats["comments_given"]
+        combined_analysis["overall_stats"]["total_comments"] += total_comments
 
     def _calculate_combined_statistics(self, combined_analysis: Dict) -> None:
         """Calculate final combined statistics."""
-        # Calculate overall averages
-        total_durations = []
-        for repo_analysis in combined_analysis["repositories"].values():
-            total_durations.extend(repo_analysis["pr_durations"])
+        # Calculate overall averages from per-repository sums, without concatenating the duration lists
+        repo_durations = [repo_analysis["pr_durations"] for repo_analysis in combined_analysis["repositories"].values()]
+        total_merged = sum(map(len, repo_durations))
 
-        if total_durations:
-            combined_analysis["overall_stats"]["avg_pr_duration_hours"] = sum(total_durations) / len(total_durations)
-
-        # Count total reviews and comments
-        combined_analysis["overall_stats"]["total_reviews"] = sum(
-            stats["reviews_given"] for stats in combined_analysis["review_stats"].values()
-        )
-        combined_analysis["overall_stats"]["total_comments"] = sum(
-            stats["comments_given"] for stats in combined_analysis["comment_stats"].values()
-        )
+        if total_merged:
+            combined_analysis["overall_stats"]["avg_pr_duration_hours"] = sum(map(sum, repo_durations)) / total_merged
 
     def _cache_analysis_results(
         self, repositories: List[str], since: str, until: str, combined_analysis: Dict
@@ -281,9 +281,10 @@ class Runner(object):
                     # Extract the date from "--since=YYYY-MM-DD" format
                     since_date = since_param.replace("--since=", "") if since_param else None
                     until_date = until_param.replace("--until=", "") if until_param else None
-                    github_data = github_integration.analyze_multiple_repositories(
-                        github_repos, since_date, until_date
-                    )
+                    with github_integration:
+                        github_data = github_integration.analyze_multiple_repositories(
+                            github_repos, since_date, until_date
+                        )
 
                     # Output GitHub analysis
                     from .output.githuboutput import GitHubOutput
@@ -9,7 +9,6 @@ Run this script to populate the cache before using gitinspector with --github.
 import os
 import sys
 import argparse
-import time
 from datetime import datetime, timezone
 from typing import List, Dict
 
@@ -65,7 +64,7 @@ def sync_repository_data(
 
         # Get PRs (incremental or full based on since parameter)
         print(f"  Fetching pull requests...")
-        prs = github_integration.get_pull_requests(owner, repo, since=since)
+        prs = github_integration.get_updated_pull_requests(owner, repo, since=since)
         print(f"  Found {len(prs)} pull requests")
 
         if prs:
@@ -85,7 +84,12 @@ def sync_repository_data(
             print("  No new PRs found")
             return
 
-        # Process each PR to get reviews and comments
+        # Process each PR to get reviews and comments; on a first sync they are cached in bulk
+        # once every PR is fetched, while an existing cache merges them PR by PR
+        repository_cached = cache.is_repository_cached(repository)
+        reviews_by_pr = {}
+        comments_by_pr = {}
+        review_comments_by_pr = {}
         total_prs = len(prs)
         for i, pr in enumerate(prs, 1):
             pr_number = pr["number"]
@@ -97,41 +101,43 @@ def sync_repository_data(
             # Get and merge reviews
             try:
                 reviews = github_integration.get_pr_reviews(owner, repo, pr_number)
-                if cache.is_repository_cached(repository):
+                if repository_cached:
                     cache.merge_reviews(repository, pr_number, reviews)
                 else:
-                    cache.cache_reviews(repository, pr_number, reviews)
+                    reviews_by_pr[pr_number] = reviews
             except Exception as e:
                 print(f"    Warning: Failed to fetch reviews for PR #{pr_number}: {e}")
-                if not cache.is_repository_cached(repository):
-                    cache.cache_reviews(repository, pr_number, [])
+                if not repository_cached:
+                    reviews_by_pr[pr_number] = []
 
             # Get and merge comments
             try:
                 comments = github_integration.get_pr_comments(owner, repo, pr_number)
-                if cache.is_repository_cached(repository):
+                if repository_cached:
                     cache.merge_comments(repository, pr_number, comments)
                 else:
-                    cache.cache_comments(repository, pr_number, comments)
+                    comments_by_pr[pr_number] = comments
             except Exception as e:
                 print(f"    Warning: Failed to fetch comments for PR #{pr_number}: {e}")
-                if not cache.is_repository_cached(repository):
-                    cache.cache_comments(repository, pr_number, [])
+                if not repository_cached:
+                    comments_by_pr[pr_number] = []
 
             # Get and merge review comments
             try:
                 review_comments = github_integration.get_pr_review_comments(owner, repo, pr_number)
-                if cache.is_repository_cached(repository):
+                if repository_cached:
                     cache.merge_review_comments(repository, pr_number, review_comments)
                 else:
-                    cache.cache_review_comments(repository, pr_number, review_comments)
+                    review_comments_by_pr[pr_number] = review_comments
             except Exception as e:
                 print(f"    Warning: Failed to fetch review comments for PR #{pr_number}: {e}")
-                if not cache.is_repository_cached(repository):
-                    cache.cache_review_comments(repository, pr_number, [])
+                if not repository_cached:
+                    review_comments_by_pr[pr_number] = []
 
-            # Rate limiting - be respectful to GitHub API
-            time.sleep(0.1)
+        if not repository_cached:
+            cache.cache_many_reviews(repository, reviews_by_pr)
+            cache.cache_many_comments(repository, comments_by_pr)
+            cache.cache_many_review_comments(repository, review_comments_by_pr)
 
         # Update cache metadata
         cache.update_cache_metadata(repository)
@@ -142,13 +148,14 @@ def sync_repository_data(
         raise
 
 
-def _create_github_integration(app_id: str, private_key: str) -> GitHubIntegration:
+def _create_github_integration(app_id: str, private_key: str, cache_dir: str) -> GitHubIntegration:
     """Create GitHub integration instance."""
     return GitHubIntegration(
         app_id,
         private_key_path=private_key if os.path.exists(private_key) else None,
         private_key_content=private_key if not os.path.exists(private_key) else None,
         use_cache=False,  # This instance will fetch from API
+        cache_dir=cache_dir,  # Keeps the ETag store next to the cache
     )
 
 
@@ -306,7 +313,7 @@ Examples:
     # Load GitHub configuration
     try:
         app_id, private_key = load_github_config()
-        github_integration = _create_github_integration(app_id, private_key)
+        github_integration = _create_github_integration(app_id, private_key, args.cache_dir)
     except GitHubIntegrationError as e:
         print(f"Error loading GitHub configuration: {e}")
         print("Please set GITHUB_APP_ID and either GITHUB_PRIVATE_KEY_PATH or GITHUB_PRIVATE_KEY")
@@ -355,6 +362,9 @@ Examples:
     except Exception as e:
         print(f"Sync failed: {e}")
         sys.exit(1)
+    finally:
+        cache.flush()
+        github_integration.close()
 
 
 if __name__ == "__main__":
@@ -146,6 +146,22 @@ class TestActivityNormalization(GitInspectorTestCase):
                     if raw_stats['commits'] > 0:
                         self.assertGreater(raw_stats['contributors'], 0)
     
+    def test_repo_unique_contributors_is_a_copy(self):
+        """Test that changing the returned contributors does not change the activity data."""
+        with GitTestRepo("contributor_copy_test") as repo:
+            ActivityTestScenarios.create_multi_developer_repo(repo)
+
+            changes_obj = changes.Changes(None, hard=True)
+            activity_data = activity.ActivityData({"contributor_copy_test": changes_obj}, useweeks=False)
+
+            contributors = activity_data.get_repo_unique_contributors("contributor_copy_test")
+            expected = set(contributors)
+            self.assertTrue(expected)
+            contributors.add("intruder")
+
+            self.assertEqual(activity_data.get_repo_unique_contributors("contributor_copy_test"), expected)
+            self.assertEqual(activity_data.get_repo_unique_contributors("missing"), set())
+
     def test_normalization_calculations(self):
         """Test that normalization calculations are correct."""
         with GitTestRepo("norm_test") as repo:
@@ -217,6 +233,25 @@ class TestActivityNormalization(GitInspectorTestCase):
             self.assertIn('insertions_per_contributor', norm_totals)
             self.assertIn('deletions_per_contributor', norm_totals)
 
+    def test_max_and_total_values_are_cached(self):
+        """Test that repeated max/total lookups reuse cached results without sharing mutable dicts."""
+        with GitTestRepo("cache_test") as repo:
+            ActivityTestScenarios.create_multi_developer_repo(repo)
+
+            changes_obj = changes.Changes(None, hard=True)
+            changes_by_repo = {"cache_test": changes_obj}
+            activity_data = activity.ActivityData(changes_by_repo, useweeks=False)
+
+            raw_max = activity_data.get_max_values(normalized=False)
+            raw_max["commits"] = -1
+            self.assertNotEqual(activity_data.get_max_values(normalized=False)["commits"], -1)
+            self.assertEqual(activity_data.get_max_values(normalized=True),
+                             activity_data.get_max_values(normalized=True))
+
+            totals = activity_data.get_total_stats(normalized=True)
+            totals["commits"] = -1
+            self.assertNotEqual(activity_data.get_total_stats(normalized=True)["commits"], -1)
+
 
 class TestActivityOutput(GitInspectorTestCase):
     """Test the ActivityOutput class and all output formats."""
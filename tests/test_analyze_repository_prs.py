@@ -5,6 +5,7 @@ Comprehensive tests for analyze_repository_prs function and related methods.
 
 import os
 import sys
+import time
 import unittest
 from unittest.mock import patch, MagicMock, call
 from datetime import datetime, timezone, timedelta
@@ -48,6 +49,10 @@ class TestAnalyzeRepositoryPRs(unittest.TestCase):
         self.assertIn("author1", analysis["user_stats"])
         self.assertIn("author2", analysis["user_stats"])
 
+        # Stats are returned as plain dicts, so unknown users are not silently added
+        for key in ("user_stats", "review_stats", "comment_stats"):
+            self.assertIs(type(analysis[key]), dict)
+
     def test_analyze_repository_prs_with_reviews_and_comments(self):
         """Test analyze_repository_prs with reviews and comments."""
         repository = "test/repo"
@@ -183,6 +188,46 @@ class TestAnalyzeRepositoryPRs(unittest.TestCase):
         self.assertEqual(analysis["open_prs"], 1)
         self.assertEqual(analysis["merged_prs"], 1)
 
+    def test_process_prs_from_api_fetches_concurrently(self):
+        """Test that API mode fetches PR data on worker threads and aggregates every PR."""
+        integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+        prs = [self.helper.create_test_pr(i, "closed", True, f"author{i}") for i in range(1, 21)]
+
+        def fetch(owner, repo, pr_number):
+            return {
+                "reviews": [self.helper.create_test_review("reviewer1")],
+                "comments": [],
+                "review_comments": [],
+                "general_comments": [],
+            }
+
+        analysis = integration._initialize_analysis_structure("test/repo")
+        with patch.object(integration, "_fetch_pr_related_data", side_effect=fetch) as mock_fetch:
+            integration._process_prs("test", "repo", prs, analysis)
+
+        self.assertEqual(mock_fetch.call_count, 20)
+        self.assertEqual(analysis["merged_prs"], 20)
+        self.assertEqual(analysis["review_stats"]["reviewer1"]["reviews_given"], 20)
+        self.assertEqual(list(analysis["user_stats"]), [f"author{i}" for i in range(1, 21)])
+
+    def test_process_prs_from_api_stops_fetching_after_an_error(self):
+        """Test that a failed PR fetch cancels the fetches that have not started yet."""
+        integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+        prs = [self.helper.create_test_pr(i, "closed", True, f"author{i}") for i in range(1, 101)]
+
+        def fetch(owner, repo, pr_number):
+            if pr_number == 1:
+                raise GitHubIntegrationError("boom")
+            time.sleep(0.01)
+            return {"reviews": [], "comments": [], "review_comments": [], "general_comments": []}
+
+        analysis = integration._initialize_analysis_structure("test/repo")
+        with patch.object(integration, "_fetch_pr_related_data", side_effect=fetch) as mock_fetch:
+            with self.assertRaises(GitHubIntegrationError):
+                integration._process_prs("test", "repo", prs, analysis)
+
+        self.assertLess(mock_fetch.call_count, len(prs))
+
     @patch("gitinspector.github_integration.print")
     def test_show_progress(self, mock_print):
         """Test the _show_progress method."""
@@ -194,17 +239,15 @@ class TestAnalyzeRepositoryPRs(unittest.TestCase):
         self.integration._show_progress(100, 100)
         mock_print.assert_called_with("  Processing PR 100/100 (100.0%)", file=sys.stderr)
 
+        # Test progress labelled with the repository
+        self.integration._show_progress(20, 100, "test/repo")
+        mock_print.assert_called_with("  test/repo: Processing PR 20/100 (20.0%)", file=sys.stderr)
+
         # Test no progress for non-milestone items
         mock_print.reset_mock()
         self.integration._show_progress(5, 100)
         mock_print.assert_not_called()
 
-    @patch("time.sleep")
-    def test_apply_rate_limiting(self, mock_sleep):
-        """Test the _apply_rate_limiting method."""
-        self.integration._apply_rate_limiting()
-        mock_sleep.assert_called_once_with(0.1)
-
     def test_fetch_pr_related_data(self):
         """Test the _fetch_pr_related_data method."""
         repository = "test/repo"
@@ -379,6 +422,11 @@ class TestAnalyzeRepositoryPRs(unittest.TestCase):
         self.assertEqual(analysis["avg_pr_duration_hours"], 14.0)  # (12+24+6)/3
         self.assertEqual(analysis["median_pr_duration_hours"], 12.0)  # Middle value when sorted
 
+        # With an even count the median is the mean of the two middle values
+        analysis["pr_durations"] = [12.0, 24.0, 6.0, 30.0]
+        self.integration._calculate_final_statistics(analysis)
+        self.assertEqual(analysis["median_pr_duration_hours"], 18.0)
+
         self._test_empty_durations(analysis)
 
     def _test_empty_durations(self, analysis):
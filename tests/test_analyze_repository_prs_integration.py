@@ -337,7 +337,7 @@ class TestAnalyzeRepositoryPRsIntegration(unittest.TestCase):
 
         # Verify logging calls
         mock_print.assert_any_call("Analyzing PRs for test/logging-repo...", file=sys.stderr)
-        mock_print.assert_any_call("  Processing PR 1/1 (100.0%)", file=sys.stderr)
+        mock_print.assert_any_call("  test/logging-repo: Processing PR 1/1 (100.0%)", file=sys.stderr)
 
     def test_workflow_with_mixed_data_types(self):
         """Test workflow with mixed data types and special characters."""
@@ -3,6 +3,8 @@
 Tests for GitHub cache module.
 """
 
+import gzip
+import json
 import os
 import sys
 import unittest
@@ -92,6 +94,27 @@ class TestGitHubCache(unittest.TestCase):
         empty_prs = self.cache.get_cached_pull_requests("nonexistent/repo")
         self.assertEqual(empty_prs, [])
 
+    def test_cached_lists_are_not_shared(self):
+        """Test that modifying cached or returned lists does not change the cache."""
+        repository = "test/repo"
+        prs = [{"number": 1}]
+        reviews = [{"id": 1}]
+        self.cache.cache_pull_requests(repository, prs)
+        self.cache.cache_reviews(repository, 1, reviews)
+
+        prs.append({"number": 2})
+        reviews.append({"id": 2})
+        self.cache.get_cached_pull_requests(repository).append({"number": 3})
+        self.cache.get_cached_reviews(repository, 1).append({"id": 3})
+        self.cache.get_cached_pull_requests("missing/repo").append({"number": 4})
+        self.cache.get_cached_reviews(repository, 999).append({"id": 4})
+
+        self.assertEqual(self.cache.get_cached_pull_requests(repository), [{"number": 1}])
+        self.assertEqual(self.cache.get_cached_reviews(repository, 1), [{"id": 1}])
+        self.assertEqual(self.cache.get_cached_pull_requests("missing/repo"), [])
+        self.assertEqual(self.cache.get_cached_pull_requests("other/repo"), [])
+        self.assertEqual(self.cache.get_cached_reviews(repository, 999), [])
+
     def test_reviews_caching(self):
         """Test reviews caching."""
         repository = "test/repo"
@@ -112,6 +135,24 @@ class TestGitHubCache(unittest.TestCase):
         empty_reviews = self.cache.get_cached_reviews(repository, 999)
         self.assertEqual(empty_reviews, [])
 
+    def test_cache_many_reviews(self):
+        """Test caching reviews for several PRs in one call."""
+        repository = "test/repo"
+        self.cache.cache_reviews(repository, 1, [{"id": 1}])
+        self.cache.cache_many_reviews(repository, {2: [{"id": 2}], 3: []})
+
+        self.assertEqual(self.cache.get_cached_reviews(repository, 1), [{"id": 1}])
+        self.assertEqual(self.cache.get_cached_reviews(repository, 2), [{"id": 2}])
+        self.assertEqual(self.cache.get_cached_reviews(repository, 3), [])
+
+    def test_cache_many_general_comments(self):
+        """Test caching general comments for several PRs in one call."""
+        repository = "test/repo"
+        self.cache.cache_many_general_comments(repository, {1: [{"id": 1}], 2: []})
+
+        self.assertEqual(self.cache.get_cached_general_comments(repository, 1), [{"id": 1}])
+        self.assertEqual(self.cache.get_cached_general_comments(repository, 2), [])
+
     def test_comments_caching(self):
         """Test comments caching."""
         repository = "test/repo"
@@ -202,6 +243,23 @@ class TestGitHubCache(unittest.TestCase):
         sizes = self.cache.get_cache_size()
         self.assertGreater(sizes["metadata"], 0)
 
+    def test_cache_size_counts_repository_shards(self):
+        """Test that cache size sums the compressed data files of every repository."""
+        for repository in ("test/repo1", "test/repo2"):
+            self.cache.cache_pull_requests(repository, [{"number": 1, "title": "Test PR"}])
+            self.cache.cache_reviews(repository, 1, [{"id": 1}])
+        self.cache.flush()
+
+        sizes = self.cache.get_cache_size()
+        for kind in ("pull_requests", "reviews"):
+            expected = sum(
+                self.cache._repository_file(repository, kind).stat().st_size
+                for repository in ("test/repo1", "test/repo2")
+            )
+            self.assertGreater(expected, 0)
+            self.assertEqual(sizes[kind], expected)
+        self.assertEqual(sizes["comments"], 0)
+
     def test_cached_repositories(self):
         """Test getting cached repositories list."""
         # Initially empty
@@ -280,6 +338,61 @@ class TestGitHubCache(unittest.TestCase):
         cleared_comments = self.cache.get_cached_general_comments(repository, pr_number)
         self.assertEqual(cleared_comments, [])
 
+    def test_writes_are_deferred_until_flush(self):
+        """Test that cache writes stay in memory until flushed."""
+        repository = "test/repo"
+        prs = [{"number": 1, "title": "Test PR 1", "state": "open"}]
+
+        self.cache.cache_pull_requests(repository, prs)
+        self.assertFalse(self.cache._repository_file(repository, "pull_requests").exists())
+        self.assertEqual(GitHubCache(self.temp_dir).get_cached_pull_requests(repository), [])
+
+        self.cache.flush()
+        self.assertEqual(GitHubCache(self.temp_dir).get_cached_pull_requests(repository), prs)
+
+    def test_metadata_update_flushes_data(self):
+        """Test that updating metadata persists the repository data cached before it."""
+        repository = "test/repo"
+        self.cache.cache_reviews(repository, 1, [{"id": 1}])
+        self.cache.update_cache_metadata(repository)
+
+        reopened = GitHubCache(self.temp_dir)
+        self.assertTrue(reopened.is_repository_cached(repository))
+        self.assertEqual(reopened.get_cached_reviews(repository, 1), [{"id": 1}])
+
+    def test_context_manager_flushes(self):
+        """Test that leaving the context manager writes pending data."""
+        with GitHubCache(self.temp_dir) as cache:
+            cache.cache_comments("test/repo", 1, [{"id": 1}])
+
+        self.assertEqual(GitHubCache(self.temp_dir).get_cached_comments("test/repo", 1), [{"id": 1}])
+
+    def test_repositories_are_stored_in_separate_files(self):
+        """Test that each repository gets its own cache files."""
+        self.cache.cache_reviews("test/repo1", 1, [{"id": 1}])
+        self.cache.cache_reviews("test/repo2", 1, [{"id": 2}])
+        self.cache.flush()
+
+        repo1_file = self.cache._repository_file("test/repo1", "reviews")
+        repo2_file = self.cache._repository_file("test/repo2", "reviews")
+        self.assertNotEqual(repo1_file, repo2_file)
+        self.assertTrue(repo1_file.exists())
+        self.assertTrue(repo2_file.exists())
+
+        self.cache.clear_repository_cache("test/repo1")
+        self.assertFalse(repo1_file.exists())
+        self.assertEqual(self.cache.get_cached_reviews("test/repo2", 1), [{"id": 2}])
+
+    def test_legacy_cache_files_are_migrated(self):
+        """Test that single-file caches from older versions are split per repository."""
+        legacy_file = Path(self.temp_dir) / "reviews.json"
+        with open(legacy_file, "w") as f:
+            f.write('{"test/repo": {"1": [{"id": 1}]}}')
+
+        cache = GitHubCache(self.temp_dir)
+        self.assertFalse(legacy_file.exists())
+        self.assertEqual(cache.get_cached_reviews("test/repo", 1), [{"id": 1}])
+
     def test_json_file_errors(self):
         """Test handling of JSON file errors."""
         # Create invalid JSON file
@@ -291,6 +404,40 @@ class TestGitHubCache(unittest.TestCase):
         with self.assertRaises(GitHubCacheError):
             self.cache.get_cache_metadata()
 
+    def test_repository_shard_round_trip(self):
+        """Test that repository data is written as gzip-compressed JSON and read back unchanged."""
+        repository = "test/repo"
+        prs = [{"number": 1, "title": "Test PR", "user": {"login": "user1"}}]
+        self.cache.cache_pull_requests(repository, prs)
+        self.cache.flush()
+
+        shard = self.cache._repository_file(repository, "pull_requests")
+        self.assertTrue(shard.name.endswith(".json.gz"))
+        self.assertEqual(json.loads(gzip.decompress(shard.read_bytes())), prs)
+        self.assertFalse(shard.with_suffix(shard.suffix + ".tmp").exists())
+        self.assertEqual(GitHubCache(self.temp_dir).get_cached_pull_requests(repository), prs)
+
+    def test_corrupt_repository_shard_errors(self):
+        """Test that unreadable repository data files raise GitHubCacheError."""
+        repository = "test/repo"
+        shard = self.cache._repository_file(repository, "pull_requests")
+        shard.parent.mkdir(parents=True)
+
+        # A valid gzip header followed by a garbled deflate stream
+        corrupt_stream = bytearray(gzip.compress(b'[{"number": 1}]' * 50))
+        corrupt_stream[12:20] = b"\xff" * 8
+
+        payloads = (
+            b"not gzip at all",
+            gzip.compress(b"[{")[:-4],
+            gzip.compress(b"invalid json"),
+            bytes(corrupt_stream),
+        )
+        for payload in payloads:
+            shard.write_bytes(payload)
+            with self.assertRaises(GitHubCacheError):
+                GitHubCache(self.temp_dir).get_cached_pull_requests(repository)
+
 
 if __name__ == "__main__":
     unittest.main()
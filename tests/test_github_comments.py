@@ -414,7 +414,7 @@ class TestGitHubComments(unittest.TestCase):
 
         pr_data = {"reviews": [], "comments": [], "review_comments": [], "general_comments": general_comments}
 
-        analysis = {"comment_stats": {}, "user_stats": {}, "review_stats": {}}
+        analysis = self.integration._initialize_analysis_structure(repository)
 
         # Call the method
         self.integration._process_pr_related_data(pr, pr_data, analysis)
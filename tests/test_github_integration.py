@@ -13,7 +13,9 @@ from unittest.mock import patch, MagicMock
 # Add gitinspector to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from datetime import datetime, timezone
 from gitinspector.github_integration import GitHubIntegration, GitHubIntegrationError, load_github_config
+from gitinspector.github_integration import TIMESTAMP_CACHE_SIZE, _parse_github_timestamp
 
 
 class TestGitHubIntegration(unittest.TestCase):
@@ -67,6 +69,36 @@ class TestGitHubIntegration(unittest.TestCase):
             # Expected to fail with invalid credentials, but class should be created
             pass
 
+    def test_parse_github_timestamp_cache_is_bounded(self):
+        """Test that GitHub timestamps parse to aware datetimes through a bounded cache."""
+        self.assertEqual(
+            _parse_github_timestamp("2024-01-02T03:04:05Z"), datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        )
+        self.assertEqual(_parse_github_timestamp.cache_info().maxsize, TIMESTAMP_CACHE_SIZE)
+
+        for index in range(TIMESTAMP_CACHE_SIZE + 10):
+            _parse_github_timestamp(f"2024-01-01T00:00:00.{index:06d}Z")
+        self.assertLessEqual(_parse_github_timestamp.cache_info().currsize, TIMESTAMP_CACHE_SIZE)
+
+    def test_create_jwt_reuses_token_until_near_expiry(self):
+        """Test that the app JWT and parsed private key are reused between calls."""
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        pem = key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode("utf-8")
+        integration = GitHubIntegration("test_app_id", private_key_content=pem, use_cache=False)
+
+        with patch("gitinspector.github_integration.time.time", return_value=1000000):
+            first = integration._create_jwt()
+            self.assertEqual(integration._create_jwt(), first)
+
+        # Within the expiry margin a new token is signed
+        with patch("gitinspector.github_integration.time.time", return_value=1000000 + 590):
+            self.assertNotEqual(integration._create_jwt(), first)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ import sys
 import unittest
 import tempfile
 import shutil
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 # Add gitinspector to path for imports
@@ -15,6 +16,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from gitinspector.github_integration import GitHubIntegration, GitHubIntegrationError
 from gitinspector.github_cache import GitHubCache
+import sync_github_cache
 
 
 class TestGitHubIntegrationCache(unittest.TestCase):
@@ -101,6 +103,19 @@ class TestGitHubIntegrationCache(unittest.TestCase):
         self.assertEqual(len(recent_prs), 1)
         self.assertEqual(recent_prs[0]["number"], 3)
 
+        # A date and time without a timezone is taken as UTC
+        naive_prs = integration.get_pull_requests("test", "repo", since="2024-01-01T12:00:00")
+        self.assertEqual([pr["number"] for pr in naive_prs], [2, 3])
+
+        # A bare until date covers that whole day
+        early_prs = integration.get_pull_requests("test", "repo", until="2024-01-01")
+        self.assertEqual([pr["number"] for pr in early_prs], [1, 2])
+
+        # An unparsable bound is reported as an integration error
+        with self.assertRaises(GitHubIntegrationError) as cm:
+            integration.get_pull_requests("test", "repo", since="not-a-date")
+        self.assertEqual(str(cm.exception), "Invalid since date: not-a-date")
+
     def test_get_pull_requests_no_cache(self):
         """Test getting pull requests when no cache data available."""
         integration = GitHubIntegration(use_cache=True, cache_dir=self.temp_dir)
@@ -173,26 +188,333 @@ class TestGitHubIntegrationCache(unittest.TestCase):
         with patch.dict(os.environ, {"GITHUB_APP_ID": "test_app", "GITHUB_PRIVATE_KEY": "test_key"}):
             integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
 
-            # Mock the entire API request method to prevent actual network requests
-            # Return data on first call, empty list on second call to break the pagination loop
-            with patch.object(integration, "_make_authenticated_request") as mock_request:
-                mock_request.side_effect = [
-                    [
-                        {
-                            "number": 1,
-                            "title": "Test PR",
-                            "state": "open",
-                            "created_at": "2024-01-01T00:00:00Z",
-                            "user": {"login": "testuser"},
-                        }
-                    ],  # First page
-                    [],  # Second page (empty, breaks the loop)
+            def make_page(number, next_url=None):
+                prs = [
+                    {
+                        "number": number,
+                        "title": "Test PR",
+                        "state": "open",
+                        "created_at": "2024-01-01T00:00:00Z",
+                        "user": {"login": "testuser"},
+                    }
                 ]
+                return prs, {"next": next_url} if next_url else {}
+
+            # Mock the API page method to prevent actual network requests
+            # The first page links to the second; the second has no next link, which ends pagination
+            with patch.object(integration, "_get_authenticated_page") as mock_request:
+                mock_request.side_effect = [make_page(1, "https://api.github.com/next"), make_page(2)]
 
                 prs = integration.get_pull_requests("test", "repo")
-                self.assertEqual(len(prs), 1)
-                self.assertEqual(prs[0]["number"], 1)
-                self.assertEqual(mock_request.call_count, 2)  # Called twice due to pagination
+                self.assertEqual([pr["number"] for pr in prs], [1, 2])
+                self.assertEqual(mock_request.call_count, 2)  # No extra request for an empty page
+                self.assertEqual(mock_request.call_args[0][2], "https://api.github.com/next")
+
+    def test_api_pull_requests_since_stops_paging_at_older_updates(self):
+        """Test that an API listing with since sorts by update time and stops at the first older PR."""
+        integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+        first_page = [
+            {"number": 3, "updated_at": "2024-03-01T00:00:00Z"},
+            {"number": 2, "updated_at": "2024-02-01T00:00:00Z"},
+        ]
+        second_page = [{"number": 1, "updated_at": "2023-12-01T00:00:00Z"}]
+
+        with patch.object(integration, "_get_authenticated_page") as mock_request:
+            mock_request.side_effect = [
+                (first_page, {"next": "https://api.github.com/next", "last": "https://api.github.com/last?page=3"}),
+                (second_page, {"next": "https://api.github.com/last?page=3"}),
+            ]
+            prs = integration.get_updated_pull_requests("test", "repo", since="2024-01-01")
+
+        self.assertEqual([pr["number"] for pr in prs], [3, 2])
+        self.assertEqual(mock_request.call_count, 2)
+        params = mock_request.call_args_list[0][0][3]
+        self.assertNotIn("since", params)
+        self.assertEqual((params["sort"], params["direction"]), ("updated", "desc"))
+
+    def test_api_and_cache_select_the_same_pull_requests(self):
+        """Test that API mode and cache mode return the same PRs for the same since/until bounds."""
+        def make_pr(number, created_at, updated_at):
+            return {"number": number, "state": "closed", "created_at": created_at, "updated_at": updated_at}
+
+        prs = [
+            make_pr(4, "2024-03-01T00:00:00Z", "2024-03-02T00:00:00Z"),
+            # Created before since but updated after it, so the API listing includes it
+            make_pr(3, "2023-12-01T00:00:00Z", "2024-02-20T00:00:00Z"),
+            make_pr(2, "2024-01-15T00:00:00Z", "2024-02-01T00:00:00Z"),
+            make_pr(1, "2023-11-01T00:00:00Z", "2023-11-02T00:00:00Z"),
+        ]
+        bounds = {"since": "2024-01-01", "until": "2024-02-29"}
+
+        cached = GitHubIntegration(use_cache=True, cache_dir=self.temp_dir)
+        cached.cache.cache_pull_requests("test/repo", prs)
+        cached.cache.update_cache_metadata("test/repo")
+        cache_numbers = [pr["number"] for pr in cached.get_pull_requests("test", "repo", **bounds)]
+
+        api = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+        with patch.object(api, "_get_authenticated_page", return_value=(prs, {})):
+            api_numbers = [pr["number"] for pr in api.get_pull_requests("test", "repo", **bounds)]
+
+        self.assertEqual(cache_numbers, [2])
+        self.assertEqual(api_numbers, cache_numbers)
+
+    def test_api_pull_requests_reject_invalid_since(self):
+        """Test that a malformed since date is reported as an integration error before any request."""
+        integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+
+        with patch.object(integration, "_get_authenticated_page") as mock_request:
+            with self.assertRaises(GitHubIntegrationError) as cm:
+                integration.get_pull_requests("test", "repo", since="2024-13-45")
+
+        self.assertEqual(str(cm.exception), "Invalid since date: 2024-13-45")
+        mock_request.assert_not_called()
+
+    def test_api_pull_requests_fetch_remaining_pages_concurrently(self):
+        """Test that pages up to the last one linked from the first page are all fetched, in order."""
+        integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+
+        def get_page(owner, repo, url, params=None):
+            page = params.get("page", 1)
+            links = {"next": f"{url}?page={page + 1}", "last": f"{url}?page=4"} if page == 1 else {}
+            return [{"number": page}], links
+
+        with patch.object(integration, "_get_authenticated_page", side_effect=get_page) as mock_request:
+            prs = integration.get_pull_requests("test", "repo")
+
+        self.assertEqual([pr["number"] for pr in prs], [1, 2, 3, 4])
+        self.assertEqual(mock_request.call_count, 4)
+        self.assertEqual(mock_request.call_args_list[1][0][3], {"state": "all", "per_page": 100, "page": 2})
+
+    def test_unchanged_responses_are_served_from_etag_store(self):
+        """Test that a 304 response returns the body stored with the ETag."""
+        integration = GitHubIntegration(
+            app_id="test_app", private_key_content="test_key", use_cache=False, cache_dir=self.temp_dir
+        )
+        first = MagicMock(status_code=200, headers={"ETag": '"abc"'}, links={})
+        first.json.return_value = [{"id": 1}]
+        first.content = b'[{"id": 1}]'
+        not_modified = MagicMock(status_code=304, headers={}, links={})
+
+        with patch.object(integration, "_get_installation_token", return_value="token"), patch.object(
+            integration.session, "get", side_effect=[first, not_modified]
+        ) as mock_get:
+            self.assertEqual(integration._make_authenticated_request("test", "repo", "pulls/1/reviews"), [{"id": 1}])
+            self.assertEqual(integration._make_authenticated_request("test", "repo", "pulls/1/reviews"), [{"id": 1}])
+
+        self.assertNotIn("If-None-Match", mock_get.call_args_list[0].kwargs["headers"])
+        self.assertEqual(mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"], '"abc"')
+        integration.close()
+
+        # The stored ETag survives into the next run once the store is closed
+        with GitHubIntegration(
+            app_id="test_app", private_key_content="test_key", use_cache=False, cache_dir=self.temp_dir
+        ) as reopened:
+            etag_key = reopened._etag_key(mock_get.call_args_list[0].args[0])
+            self.assertEqual(reopened._get_etag_entry(etag_key)["etag"], '"abc"')
+
+    def test_clearing_the_cache_removes_the_etag_store(self):
+        """Test that clearing the cache also drops stored ETags and response bodies."""
+        integration = GitHubIntegration(
+            app_id="test_app", private_key_content="test_key", use_cache=False, cache_dir=self.temp_dir
+        )
+        integration._get_etag_entry("key")
+        integration._set_etag_entry("key", {"etag": '"abc"', "body": [], "links": {}})
+        integration.close()
+        self.assertTrue(list(Path(self.temp_dir).glob("etags*")))
+
+        GitHubCache(self.temp_dir).clear_all_cache()
+
+        self.assertEqual(list(Path(self.temp_dir).glob("etags*")), [])
+        self.assertIsNone(integration._get_etag_entry("key"))
+        integration.close()
+
+    def test_sync_clear_removes_the_etag_store(self):
+        """Test that the sync script's --clear option also removes the ETag store."""
+        integration = GitHubIntegration(
+            app_id="test_app", private_key_content="test_key", use_cache=False, cache_dir=self.temp_dir
+        )
+        integration._get_etag_entry("key")
+        integration._set_etag_entry("key", {"etag": '"abc"', "body": [], "links": {}})
+        integration.close()
+
+        argv = ["sync_github_cache.py", "--clear", "--cache-dir", self.temp_dir]
+        with patch.object(sys, "argv", argv), patch("builtins.print"):
+            sync_github_cache.main()
+
+        self.assertEqual(list(Path(self.temp_dir).glob("etags*")), [])
+
+    def test_etag_store_is_capped(self):
+        """Test that the ETag store stops growing at its cap and starts afresh once found full."""
+        integration = GitHubIntegration(
+            app_id="test_app", private_key_content="test_key", use_cache=False, cache_dir=self.temp_dir
+        )
+        entry = {"etag": '"abc"', "body": [], "links": {}}
+
+        with patch("gitinspector.github_integration.ETAG_STORE_MAX_ENTRIES", 2):
+            integration._get_etag_entry("first")
+            for key in ("first", "second", "third"):
+                integration._set_etag_entry(key, entry)
+            self.assertIsNotNone(integration._get_etag_entry("second"))
+            self.assertIsNone(integration._get_etag_entry("third"))
+            # Existing entries can still be refreshed
+            integration._set_etag_entry("first", dict(entry, etag='"def"'))
+            self.assertEqual(integration._get_etag_entry("first")["etag"], '"def"')
+            integration.close()
+
+            self.assertIsNone(integration._get_etag_entry("first"))
+        integration.close()
+
+    def test_unwritable_etag_store_is_skipped(self):
+        """Test that requests still succeed when the ETag store cannot be opened."""
+        blocker = os.path.join(self.temp_dir, "not-a-directory")
+        open(blocker, "w").close()
+        integration = GitHubIntegration(
+            app_id="test_app", private_key_content="test_key", use_cache=False, cache_dir=blocker
+        )
+        response = MagicMock(status_code=200, headers={"ETag": '"abc"'}, links={}, content=b"[]")
+        response.json.return_value = []
+
+        with patch.object(integration, "_get_installation_token", return_value="token"), patch.object(
+            integration.session, "get", return_value=response
+        ), patch("gitinspector.github_integration.print") as mock_print:
+            self.assertEqual(integration._make_authenticated_request("test", "repo", "pulls/1/reviews"), [])
+            self.assertEqual(integration._make_authenticated_request("test", "repo", "pulls/1/reviews"), [])
+
+        # The failure is reported once and the store is not retried
+        self.assertEqual(mock_print.call_count, 1)
+        integration.close()
+
+    def test_installation_tokens_are_reused_across_instances(self):
+        """Test that a minted installation token is saved privately and reused by a new instance."""
+        tokens_path = os.path.join(self.temp_dir, "tokens", "installation_tokens.json")
+        integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+        integration.installation_tokens_path = tokens_path
+
+        installation = MagicMock(status_code=200)
+        installation.json.return_value = {"id": 42}
+        access_token = MagicMock(status_code=201)
+        access_token.json.return_value = {
+            "token": "secret",
+            "expires_at": "2999-01-01T00:00:00Z",
+            "repository_selection": "all",
+        }
+
+        with patch.object(integration, "_create_jwt", return_value="jwt"), patch.object(
+            integration.session, "get", return_value=installation
+        ), patch.object(integration.session, "post", return_value=access_token):
+            self.assertEqual(integration._get_installation_token("test", "repo"), "secret")
+
+        self.assertEqual(os.stat(tokens_path).st_mode & 0o777, 0o600)
+
+        reloaded = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+        reloaded.installation_tokens_path = tokens_path
+        with patch.object(reloaded.session, "get") as mock_get:
+            self.assertEqual(reloaded._get_installation_token("test", "repo"), "secret")
+            # Other repositories of the same owner share the installation token
+            self.assertEqual(reloaded._get_installation_token("test", "other-repo"), "secret")
+            mock_get.assert_not_called()
+
+    def test_selected_repository_tokens_are_not_shared_by_owner(self):
+        """Test that a token limited to selected repositories is only reused for its own repository."""
+        integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+        integration.installation_tokens_path = os.path.join(self.temp_dir, "installation_tokens.json")
+
+        installation = MagicMock(status_code=200)
+        installation.json.return_value = {"id": 42}
+        access_token = MagicMock(status_code=201)
+        access_token.json.return_value = {
+            "token": "secret",
+            "expires_at": "2999-01-01T00:00:00Z",
+            "repository_selection": "selected",
+        }
+
+        with patch.object(integration, "_create_jwt", return_value="jwt"), patch.object(
+            integration.session, "get", return_value=installation
+        ) as mock_get, patch.object(integration.session, "post", return_value=access_token):
+            integration._get_installation_token("test", "repo")
+            integration._get_installation_token("test", "repo")
+            self.assertEqual(mock_get.call_count, 1)
+
+            integration._get_installation_token("test", "other-repo")
+            self.assertEqual(mock_get.call_count, 2)
+
+    def test_api_mode_analyzes_repositories_concurrently(self):
+        """Test that API mode aggregates concurrent repository analyses in order, skipping failures."""
+        integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+
+        def analyze(owner, repo, since, until):
+            if repo == "broken":
+                raise GitHubIntegrationError("boom")
+            analysis = integration._initialize_analysis_structure(f"{owner}/{repo}")
+            analysis["total_prs"] = 2
+            return analysis
+
+        combined = integration._initialize_combined_analysis_structure(3)
+        with patch.object(integration, "analyze_repository_prs", side_effect=analyze), patch(
+            "gitinspector.github_integration.print"
+        ):
+            integration._process_repositories(["test/a", "test/broken", "test/b"], None, None, combined)
+
+        self.assertEqual(list(combined["repositories"]), ["test/a", "test/b"])
+        self.assertEqual(combined["overall_stats"]["total_prs"], 4)
+
+    def test_combined_review_and_comment_totals(self):
+        """Test that overall review and comment totals are summed across aggregated repositories."""
+        integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+        first = integration._initialize_analysis_structure("test/a")
+        first["review_stats"]["alice"]["reviews_given"] = 2
+        first["comment_stats"]["alice"]["comments_given"] = 3
+        second = integration._initialize_analysis_structure("test/b")
+        second["review_stats"]["alice"]["reviews_given"] = 1
+        second["review_stats"]["bob"]["reviews_given"] = 4
+        second["comment_stats"]["bob"]["comments_given"] = 5
+
+        combined = integration._initialize_combined_analysis_structure(2)
+        integration._aggregate_repository_results(["test/a", "test/b"], [first, second], combined)
+        integration._calculate_combined_statistics(combined)
+
+        self.assertEqual(combined["overall_stats"]["total_reviews"], 7)
+        self.assertEqual(combined["overall_stats"]["total_comments"], 8)
+        self.assertEqual(combined["review_stats"]["alice"]["reviews_given"], 3)
+
+    def test_session_retries_transient_errors(self):
+        """Test that the API session mounts a pooled adapter that retries transient errors."""
+        integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+        adapter = integration.session.get_adapter("https://api.github.com")
+
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertGreaterEqual(adapter._pool_maxsize, 10)
+        self.assertEqual(integration.session.headers["X-GitHub-Api-Version"], integration.api_version)
+
+    def test_rate_limit_waits_for_reset(self):
+        """Test that a nearly exhausted rate limit waits until the reset time."""
+        integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+        response = MagicMock()
+
+        with patch("time.sleep") as mock_sleep, patch("time.time", return_value=1000):
+            response.headers = {"X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "1030"}
+            integration._wait_for_rate_limit(response)
+            mock_sleep.assert_not_called()
+
+            response.headers = {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "1030"}
+            with patch("gitinspector.github_integration.print"):
+                integration._wait_for_rate_limit(response)
+            mock_sleep.assert_called_once_with(30)
+
+    def test_rate_limit_paces_requests_when_budget_is_low(self):
+        """Test that a low remaining budget spreads requests over the rest of the window."""
+        integration = GitHubIntegration(app_id="test_app", private_key_content="test_key", use_cache=False)
+        response = MagicMock()
+        response.headers = {"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "1200"}
+
+        with patch("time.sleep") as mock_sleep, patch("time.time", return_value=1000):
+            integration._wait_for_rate_limit(response)
+            mock_sleep.assert_not_called()
+
+            # 200 seconds left for 100 requests: the next request waits a 2 second slot
+            integration._wait_for_rate_limit(response)
+            mock_sleep.assert_called_once_with(2)
 
     def test_analyze_repository_prs_with_cache(self):
         """Test analyzing repository PRs with cache."""
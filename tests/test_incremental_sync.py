@@ -6,6 +6,7 @@ Tests for incremental sync functionality.
 import os
 import sys
 import unittest
+import unittest.mock
 import tempfile
 import shutil
 from datetime import datetime, timezone
@@ -245,5 +246,23 @@ class TestIncrementalSync(unittest.TestCase):
         self.assertEqual(new_latest_time, "2024-01-02T16:00:00Z")
 
 
+    def test_latest_activity_time_is_recorded_in_metadata(self):
+        """Test that latest activity is recorded once and advanced by merges without rescanning."""
+        repository = "test/repo"
+        self.cache.cache_pull_requests(repository, [{"number": 1, "updated_at": "2024-01-01T10:00:00Z"}])
+
+        self.assertEqual(self.cache.get_latest_activity_time(repository), "2024-01-01T10:00:00Z")
+        self.assertEqual(self.cache.get_cache_metadata()["latest_activity"][repository], "2024-01-01T10:00:00Z")
+
+        self.cache.merge_reviews(repository, 1, [{"id": 1, "submitted_at": "2024-01-05T10:00:00Z"}])
+        with unittest.mock.patch.object(self.cache, "_scan_latest_activity_time") as scan:
+            self.assertEqual(self.cache.get_latest_activity_time(repository), "2024-01-05T10:00:00Z")
+            scan.assert_not_called()
+
+        # Replacing cached data invalidates the recorded value
+        self.cache.cache_reviews(repository, 1, [])
+        self.assertEqual(self.cache.get_latest_activity_time(repository), "2024-01-01T10:00:00Z")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -59,16 +59,20 @@ class TestTestMode(unittest.TestCase):
             {"number": i, "title": f"PR {i}", "updated_at": "2024-01-01T10:00:00Z"} for i in range(1, 10)  # 9 PRs
         ]
 
-        mock_integration.get_pull_requests.return_value = mock_prs
-        mock_integration.get_pr_reviews.return_value = []
+        mock_integration.get_updated_pull_requests.return_value = mock_prs
+        mock_integration.get_pr_reviews.return_value = [{"id": 1, "user": {"login": "reviewer"}}]
         mock_integration.get_pr_comments.return_value = []
         mock_integration.get_pr_review_comments.return_value = []
 
-        # Run sync in test mode
-        with patch("sync_github_cache.GitHubIntegration", return_value=mock_integration):
+        # Run sync in test mode; a first sync caches reviews and comments in bulk
+        with patch("sync_github_cache.GitHubIntegration", return_value=mock_integration), patch.object(
+            self.cache, "cache_reviews"
+        ) as mock_cache_reviews:
             sync_repository_data(
                 mock_integration, self.cache, "test", "repo", since="2024-01-01T00:00:00Z", test_mode=True
             )
+        mock_cache_reviews.assert_not_called()
+        self.assertEqual(self.cache.get_cached_reviews("test/repo", 5), [{"id": 1, "user": {"login": "reviewer"}}])
 
         # Check that only 5 PRs were processed
         cached_prs = self.cache.get_cached_pull_requests("test/repo")
@@ -101,7 +105,7 @@ class TestTestMode(unittest.TestCase):
             {"number": 8, "title": "New PR 8", "updated_at": "2024-01-08T10:00:00Z"},
         ]
 
-        mock_integration.get_pull_requests.return_value = new_prs
+        mock_integration.get_updated_pull_requests.return_value = new_prs
         mock_integration.get_pr_reviews.return_value = []
         mock_integration.get_pr_comments.return_value = []
         mock_integration.get_pr_review_comments.return_value = []
@@ -137,7 +141,7 @@ class TestTestMode(unittest.TestCase):
             {"number": i, "title": f"PR {i}", "updated_at": "2024-01-01T10:00:00Z"} for i in range(1, 8)  # 7 PRs
         ]
 
-        mock_integration.get_pull_requests.return_value = mock_prs
+        mock_integration.get_updated_pull_requests.return_value = mock_prs
         mock_integration.get_pr_reviews.return_value = []
         mock_integration.get_pr_comments.return_value = []
         mock_integration.get_pr_review_comments.return_value = []